@@ -1,7 +1,9 @@
 """FastAPI application for Reddit Hate Speech Detection System API"""
-from fastapi import FastAPI, Depends, HTTPException, Query, status
+import zlib
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from fastapi.routing import APIRoute
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from src.config import setup_logging
 from src.database.database import get_db, init_db
@@ -20,6 +22,46 @@ app = FastAPI(
 )
 
 
+# ==================== Request Decoding ====================
+
+# Upper bound for a gunzipped request body; a few KB of gzip can expand to gigabytes
+MAX_DECOMPRESSED_BODY_BYTES = 32 * 1024 * 1024
+
+
+class GzipRequest(Request):
+    """Request whose body is transparently gunzipped when sent with Content-Encoding: gzip"""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                # Ask for one byte past the cap so an oversized body is detectable
+                body = decompressor.decompress(body, MAX_DECOMPRESSED_BODY_BYTES + 1)
+                if len(body) > MAX_DECOMPRESSED_BODY_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Decompressed request body is too large"
+                    )
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """Route that hands endpoints a GzipRequest so large bulk uploads can be compressed"""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def gzip_route_handler(request: Request):
+            return await original_route_handler(GzipRequest(request.scope, request.receive))
+
+        return gzip_route_handler
+
+
+app.router.route_class = GzipRoute
+
+
 # ==================== Startup/Shutdown Events ====================
 
 @app.on_event("startup")
@@ -63,7 +105,7 @@ async def create_post(post: schemas.PostCreate, db: Session = Depends(get_db)):
             detail=f"Post with id {post.id} already exists"
         )
 
-    return crud.create_post(db, post.dict())
+    return crud.create_post(db, post.model_dump(exclude_none=True))
 
 
 @app.get("/posts", response_model=List[schemas.PostResponse], tags=["Posts"])
@@ -152,7 +194,7 @@ async def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
             detail=f"User {user.username} already exists"
         )
 
-    return crud.create_user(db, user.dict())
+    return crud.create_user(db, user.model_dump(exclude_none=True))
 
 
 @app.get("/users", response_model=List[schemas.UserResponse], tags=["Users"])
@@ -238,51 +280,13 @@ async def delete_user(username: str, db: Session = Depends(get_db)):
 @app.post("/bulk/posts", status_code=status.HTTP_201_CREATED, tags=["Bulk Import"])
 async def bulk_create_posts(posts: List[schemas.PostCreate], db: Session = Depends(get_db)):
     """Bulk create posts"""
-    created_count = 0
-    skipped_count = 0
-    errors = []
-
-    for post in posts:
-        try:
-            existing_post = crud.get_post(db, post.id)
-            if not existing_post:
-                crud.create_post(db, post.model_dump())
-                created_count += 1
-            else:
-                skipped_count += 1
-        except Exception as e:
-            errors.append({"post_id": post.id, "error": str(e)})
-
-    return {
-        "created": created_count,
-        "skipped": skipped_count,
-        "errors": errors
-    }
+    return crud.bulk_create_posts(db, [post.model_dump(exclude_none=True) for post in posts])
 
 
 @app.post("/bulk/users", status_code=status.HTTP_201_CREATED, tags=["Bulk Import"])
 async def bulk_create_users(users: List[schemas.UserCreate], db: Session = Depends(get_db)):
     """Bulk create users"""
-    created_count = 0
-    skipped_count = 0
-    errors = []
-
-    for user in users:
-        try:
-            existing_user = crud.get_user(db, user.username)
-            if not existing_user:
-                crud.create_user(db, user.model_dump())
-                created_count += 1
-            else:
-                skipped_count += 1
-        except Exception as e:
-            errors.append({"username": user.username, "error": str(e)})
-
-    return {
-        "created": created_count,
-        "skipped": skipped_count,
-        "errors": errors
-    }
+    return crud.bulk_create_users(db, [user.model_dump(exclude_none=True) for user in users])
 
 
 # ==================== Alert Endpoints ====================
@@ -362,6 +366,12 @@ async def create_monitoring_log(log: schemas.MonitoringLogCreate, db: Session =
     return crud.create_monitoring_log(db, log.model_dump())
 
 
+@app.post("/monitoring-logs/bulk", status_code=status.HTTP_201_CREATED, tags=["Monitoring"])
+async def bulk_create_monitoring_logs(logs: List[schemas.MonitoringLogCreate], db: Session = Depends(get_db)):
+    """Create many monitoring log entries in one transaction"""
+    return {"created": crud.create_monitoring_logs(db, [log.model_dump() for log in logs])}
+
+
 @app.get("/monitoring-logs", response_model=List[schemas.MonitoringLogResponse], tags=["Monitoring"])
 async def get_monitoring_logs(
     skip: int = Query(0, ge=0),
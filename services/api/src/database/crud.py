@@ -2,34 +2,53 @@
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, insert
 
 from src.database.models import Post, User, Alert, MonitoringLog
 
 
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z'"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 # ==================== Post CRUD ====================
 
-def create_post(db: Session, post_data: Dict[str, Any]) -> Post:
-    """Create a new post"""
-    # Extract risk assessment if present
-    risk_assessment = post_data.pop('risk_assessment', {})
+def _post_row(post_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten API post data into Post column values"""
+    # Older clients nest the risk fields; newer ones send the columns directly
+    risk_assessment = post_data.pop('risk_assessment', None)
+    if risk_assessment is not None:
+        post_data.update(
+            risk_score=risk_assessment.get('risk_score', 0),
+            risk_level=risk_assessment.get('risk_level', 'minimal'),
+            hate_score=risk_assessment.get('hate_score', 0),
+            violence_score=risk_assessment.get('violence_score', 0),
+            risk_explanation=risk_assessment.get('explanation', ''),
+            risk_flags=risk_assessment.get('flags', [])
+        )
 
     # Handle scored_at conversion before using post_data
     scored_at_value = post_data.get('scored_at')
     if scored_at_value and isinstance(scored_at_value, str):
-        post_data['scored_at'] = datetime.fromisoformat(scored_at_value)
+        post_data['scored_at'] = _parse_iso(scored_at_value)
     elif scored_at_value is None:
         post_data.pop('scored_at', None)  # Remove if None
 
-    db_post = Post(
-        **post_data,
-        risk_score=risk_assessment.get('risk_score', 0),
-        risk_level=risk_assessment.get('risk_level', 'minimal'),
-        hate_score=risk_assessment.get('hate_score', 0),
-        violence_score=risk_assessment.get('violence_score', 0),
-        risk_explanation=risk_assessment.get('explanation', ''),
-        risk_flags=risk_assessment.get('flags', [])
-    )
+    return {
+        'risk_score': 0,
+        'risk_level': 'minimal',
+        'hate_score': 0,
+        'violence_score': 0,
+        'risk_explanation': '',
+        'risk_flags': [],
+        **post_data
+    }
+
+
+def create_post(db: Session, post_data: Dict[str, Any]) -> Post:
+    """Create a new post"""
+    db_post = Post(**_post_row(post_data))
 
     db.add(db_post)
     db.commit()
@@ -105,34 +124,50 @@ def delete_post(db: Session, post_id: str) -> bool:
 
 # ==================== User CRUD ====================
 
-def create_user(db: Session, user_data: Dict[str, Any]) -> User:
-    """Create a new user"""
-    # Extract risk assessment if present
-    risk_assessment = user_data.pop('risk_assessment', {})
-    statistics = user_data.pop('statistics', {})
+def _user_row(user_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten API user data into User column values"""
+    # Older clients nest risk and statistics fields; newer ones send the columns directly
+    risk_assessment = user_data.pop('risk_assessment', None)
+    if risk_assessment is not None:
+        user_data.update(
+            risk_score=risk_assessment.get('risk_score', 0),
+            risk_level=risk_assessment.get('risk_level', 'minimal'),
+            hate_score=risk_assessment.get('hate_score', 0),
+            violence_score=risk_assessment.get('violence_score', 0),
+            risk_explanation=risk_assessment.get('explanation', ''),
+            risk_factors=risk_assessment.get('risk_factors', [])
+        )
+    statistics = user_data.pop('statistics', None)
+    if statistics is not None:
+        user_data.update(statistics)
 
     # Handle scored_at conversion before using user_data
     scored_at_value = user_data.get('scored_at')
     if scored_at_value and isinstance(scored_at_value, str):
-        user_data['scored_at'] = datetime.fromisoformat(scored_at_value)
+        user_data['scored_at'] = _parse_iso(scored_at_value)
     elif scored_at_value is None:
         user_data.pop('scored_at', None)  # Remove if None
 
-    db_user = User(
-        **user_data,
-        risk_score=risk_assessment.get('risk_score', 0),
-        risk_level=risk_assessment.get('risk_level', 'minimal'),
-        hate_score=risk_assessment.get('hate_score', 0),
-        violence_score=risk_assessment.get('violence_score', 0),
-        risk_explanation=risk_assessment.get('explanation', ''),
-        risk_factors=risk_assessment.get('risk_factors', []),
-        total_posts_analyzed=statistics.get('total_posts_analyzed', 0),
-        flagged_posts_count=statistics.get('flagged_posts_count', 0),
-        flagged_comments_count=statistics.get('flagged_comments_count', 0),
-        avg_post_risk_score=statistics.get('avg_post_risk_score', 0.0),
-        avg_comment_risk_score=statistics.get('avg_comment_risk_score', 0.0),
-        max_risk_score_seen=statistics.get('max_risk_score_seen', 0)
-    )
+    return {
+        'risk_score': 0,
+        'risk_level': 'minimal',
+        'hate_score': 0,
+        'violence_score': 0,
+        'risk_explanation': '',
+        'risk_factors': [],
+        'total_posts_analyzed': 0,
+        'flagged_posts_count': 0,
+        'flagged_comments_count': 0,
+        'avg_post_risk_score': 0.0,
+        'avg_comment_risk_score': 0.0,
+        'max_risk_score_seen': 0,
+        **user_data
+    }
+
+
+def create_user(db: Session, user_data: Dict[str, Any]) -> User:
+    """Create a new user"""
+    db_user = User(**_user_row(user_data))
 
     db.add(db_user)
     db.commit()
@@ -281,6 +316,14 @@ def create_monitoring_log(db: Session, log_data: Dict[str, Any]) -> MonitoringLo
     return db_log
 
 
+def create_monitoring_logs(db: Session, logs: List[Dict[str, Any]]) -> int:
+    """Create monitoring log entries with one INSERT and commit; returns the count"""
+    if logs:
+        db.execute(insert(MonitoringLog), logs)
+        db.commit()
+    return len(logs)
+
+
 def get_monitoring_logs(
     db: Session,
     username: Optional[str] = None,
@@ -303,6 +346,60 @@ def get_monitoring_logs(
     return query.order_by(desc(MonitoringLog.created_at)).offset(skip).limit(limit).all()
 
 
+# ==================== Bulk Import ====================
+
+def _bulk_create(
+    db: Session,
+    model,
+    key: str,
+    error_key: str,
+    items: List[Dict[str, Any]],
+    to_row,
+    create_one
+) -> Dict[str, Any]:
+    """Insert items whose key is not stored yet with a single INSERT"""
+    key_column = getattr(model, key)
+    keys = [item[key] for item in items]
+    existing = {row[0] for row in db.query(key_column).filter(key_column.in_(keys))}
+
+    # Keep the first occurrence of each new key, as one-by-one inserts would
+    pending = {}
+    for item in items:
+        if item[key] not in existing and item[key] not in pending:
+            pending[item[key]] = item
+
+    result = {"created": 0, "skipped": len(items) - len(pending), "errors": []}
+    if not pending:
+        return result
+
+    try:
+        db.execute(insert(model), [to_row(dict(item)) for item in pending.values()])
+        db.commit()
+        result["created"] = len(pending)
+    except Exception:
+        # Fall back to row-by-row inserts so only the failing items are reported
+        db.rollback()
+        for item_key, item in pending.items():
+            try:
+                create_one(db, dict(item))
+                result["created"] += 1
+            except Exception as e:
+                db.rollback()
+                result["errors"].append({error_key: item_key, "error": str(e)})
+
+    return result
+
+
+def bulk_create_posts(db: Session, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create posts that do not exist yet; returns created/skipped/errors counts"""
+    return _bulk_create(db, Post, 'id', 'post_id', posts, _post_row, create_post)
+
+
+def bulk_create_users(db: Session, users: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create users that do not exist yet; returns created/skipped/errors counts"""
+    return _bulk_create(db, User, 'username', 'username', users, _user_row, create_user)
+
+
 # ==================== Statistics ====================
 
 def get_statistics(db: Session) -> Dict[str, Any]:
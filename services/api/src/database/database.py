@@ -1,9 +1,10 @@
 """Database connection and session management"""
 import logging
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 from src.config import settings
@@ -11,14 +12,51 @@ from src.database.models import Base
 
 logger = logging.getLogger(__name__)
 
+IS_SQLITE = "sqlite" in settings.database_url
+
+# Seconds before a pooled server connection is replaced; pre-ping still
+# catches connections the server dropped sooner
+POOL_RECYCLE_SECONDS = 300
+
+
+def json_serializer(value: Any) -> str:
+    """Encode JSON columns (risk flags, findings) with orjson"""
+    return orjson.dumps(value).decode()
+
+
 # Create engine
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
     echo=False,  # Set to True for SQL query logging
-    pool_pre_ping=True,  # Verify connections before using them
+    pool_pre_ping=not IS_SQLITE,
+    pool_recycle=-1 if IS_SQLITE else POOL_RECYCLE_SECONDS,  # SQLite files never go stale
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
 )
 
+# SQLite tuning: WAL lets readers run during writes and NORMAL sync skips the
+# per-commit fsync of the default rollback journal
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if IS_SQLITE:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Create sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
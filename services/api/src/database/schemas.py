@@ -1,7 +1,7 @@
 """Pydantic schemas for API request/response models"""
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ==================== Post Schemas ====================
@@ -38,8 +38,14 @@ class PostBase(BaseModel):
 
 
 class PostCreate(PostBase):
-    """Schema for creating a post"""
+    """Schema for creating a post; risk fields may be nested or flat (column names)"""
     risk_assessment: Optional[RiskAssessmentBase] = None
+    risk_score: Optional[int] = None
+    risk_level: Optional[str] = None
+    hate_score: Optional[int] = None
+    violence_score: Optional[int] = None
+    risk_explanation: Optional[str] = None
+    risk_flags: Optional[List[str]] = None
     scored_at: Optional[datetime] = None
 
 
@@ -63,8 +69,7 @@ class PostResponse(PostBase):
     collected_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== User Schemas ====================
@@ -92,9 +97,21 @@ class UserBase(BaseModel):
 
 
 class UserCreate(UserBase):
-    """Schema for creating a user"""
+    """Schema for creating a user; risk and statistics fields may be nested or flat (column names)"""
     risk_assessment: Optional[RiskAssessmentBase] = None
     statistics: Optional[UserStatisticsBase] = None
+    risk_score: Optional[int] = None
+    risk_level: Optional[str] = None
+    hate_score: Optional[int] = None
+    violence_score: Optional[int] = None
+    risk_explanation: Optional[str] = None
+    risk_factors: Optional[List[Dict[str, Any]]] = None
+    total_posts_analyzed: Optional[int] = None
+    flagged_posts_count: Optional[int] = None
+    flagged_comments_count: Optional[int] = None
+    avg_post_risk_score: Optional[float] = None
+    avg_comment_risk_score: Optional[float] = None
+    max_risk_score_seen: Optional[int] = None
     scored_at: Optional[datetime] = None
 
 
@@ -129,8 +146,7 @@ class UserResponse(UserBase):
     collected_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== Alert Schemas ====================
@@ -169,8 +185,7 @@ class AlertResponse(AlertBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== Monitoring Log Schemas ====================
@@ -193,8 +208,7 @@ class MonitoringLogResponse(MonitoringLogBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== Statistics Schema ====================
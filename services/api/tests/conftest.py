@@ -8,8 +8,9 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
+import orjson
 
-from src.database.database import get_db
+from src.database.database import get_db, json_serializer
 from src.database.models import Base, Post, User, Alert, MonitoringLog
 
 
@@ -20,6 +21,8 @@ engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -1,8 +1,11 @@
 """Tests for API endpoints"""
+import gzip
+import json
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+import src.api as api_module
 from src.database.models import User, Post, Alert, MonitoringLog
 
 
@@ -318,6 +321,67 @@ class TestBulkEndpoints:
         assert data["skipped"] == 0
         assert data["errors"] == []
 
+    def test_bulk_create_posts_flat_risk_fields(
+        self, client: TestClient, db_with_user: tuple[Session, User], sample_post_data_api: dict
+    ):
+        """Test posts may send risk fields flat, using the column names"""
+        post = {key: value for key, value in sample_post_data_api.items() if key != "risk_assessment"}
+        post.update(risk_score=42, risk_level="medium", hate_score=30, violence_score=12,
+                    risk_explanation="Flat fields", risk_flags=["flat"])
+
+        response = client.post("/bulk/posts", json=[post])
+        assert response.status_code == 201
+        assert response.json()["created"] == 1
+
+        stored = client.get(f"/posts/{post['id']}").json()
+        assert stored["risk_score"] == 42
+        assert stored["risk_level"] == "medium"
+        assert stored["risk_flags"] == ["flat"]
+
+    def test_bulk_create_users_flat_fields(self, client: TestClient, sample_user_data_api: dict):
+        """Test users may send risk and statistics fields flat, using the column names"""
+        user = {
+            key: value for key, value in sample_user_data_api.items()
+            if key not in ("risk_assessment", "statistics")
+        }
+        user.update(risk_score=60, risk_level="high", total_posts_analyzed=12, max_risk_score_seen=75)
+
+        response = client.post("/bulk/users", json=[user])
+        assert response.status_code == 201
+        assert response.json()["created"] == 1
+
+        stored = client.get(f"/users/{user['username']}").json()
+        assert stored["risk_score"] == 60
+        assert stored["total_posts_analyzed"] == 12
+        assert stored["max_risk_score_seen"] == 75
+        assert stored["hate_score"] == 0
+
+    def test_bulk_create_posts_gzip_body(
+        self, client: TestClient, db_with_user: tuple[Session, User], sample_post_data_api: dict
+    ):
+        """Test bulk uploads may be sent gzip-compressed"""
+        body = gzip.compress(json.dumps([sample_post_data_api]).encode())
+
+        response = client.post(
+            "/bulk/posts",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 201
+        assert response.json()["created"] == 1
+
+    def test_bulk_create_posts_gzip_bomb_rejected(self, client: TestClient, monkeypatch):
+        """Test a gzip body that expands past the cap is refused with 413"""
+        monkeypatch.setattr(api_module, "MAX_DECOMPRESSED_BODY_BYTES", 1024)
+        body = gzip.compress(b"[" + b" " * 10_000 + b"]")
+
+        response = client.post(
+            "/bulk/posts",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 413
+
     def test_bulk_create_posts_with_duplicates(
         self, client: TestClient, db_with_post: tuple[Session, Post], sample_post_data_api: dict
     ):
@@ -540,6 +604,20 @@ class TestMonitoringLogEndpoints:
         assert "id" in data
         assert "created_at" in data
 
+    def test_bulk_create_monitoring_logs(
+        self, client: TestClient, db_with_user: tuple[Session, User], sample_monitoring_log_data_api: dict
+    ):
+        """Test creating several monitoring logs in one request"""
+        second_log = {**sample_monitoring_log_data_api, "activity_type": "alert"}
+        response = client.post("/monitoring-logs/bulk", json=[sample_monitoring_log_data_api, second_log])
+        assert response.status_code == 201
+        assert response.json() == {"created": 2}
+
+        logs = client.get("/monitoring-logs", params={"username": "test_user"}).json()
+        assert {log["activity_type"] for log in logs} == {
+            sample_monitoring_log_data_api["activity_type"], "alert"
+        }
+
     def test_create_monitoring_log_minimal_data(
         self, client: TestClient, db_with_user: tuple[Session, User]
     ):
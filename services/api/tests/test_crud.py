@@ -39,6 +39,18 @@ class TestPostCRUD:
         assert post.risk_score == 0
         assert post.risk_level == "minimal"
 
+    def test_create_post_parses_iso_scored_at(
+        self, db_with_user: tuple[Session, User], sample_post_data: dict
+    ):
+        """Test a string scored_at with a 'Z' suffix is stored as a datetime"""
+        db_session, user = db_with_user
+        post_data = copy.deepcopy(sample_post_data)
+        post_data["scored_at"] = "2024-01-15T10:30:00Z"
+
+        post = crud.create_post(db_session, post_data)
+
+        assert post.scored_at.replace(tzinfo=None) == datetime(2024, 1, 15, 10, 30)
+
     def test_get_post(self, db_with_post: tuple[Session, Post]):
         """Test getting a post by ID"""
         db_session, existing_post = db_with_post
@@ -474,6 +486,62 @@ class TestMonitoringLogCRUD:
         assert len(logs) == 1
         assert logs[0].activity_type == "scan"
 
+    def test_create_monitoring_logs(self, db_with_user: tuple[Session, User]):
+        """Test creating several monitoring log entries at once"""
+        db_session, user = db_with_user
+        logs = [
+            {"username": user.username, "activity_type": "daily_scan", "findings": {"max_risk_score": i}}
+            for i in range(3)
+        ]
+
+        assert crud.create_monitoring_logs(db_session, logs) == 3
+        assert crud.create_monitoring_logs(db_session, []) == 0
+
+        stored = crud.get_monitoring_logs(db_session, username=user.username)
+        assert len(stored) == 3
+        assert all(log.created_at is not None for log in stored)
+
+
+class TestBulkCRUD:
+    """Tests for bulk create operations"""
+
+    def test_bulk_create_posts(self, db_with_post: tuple[Session, Post], sample_post_data: dict):
+        """Test existing and repeated posts are skipped and new ones inserted"""
+        db_session, existing_post = db_with_post
+        new_post = {**copy.deepcopy(sample_post_data), "id": "new_post"}
+
+        result = crud.bulk_create_posts(
+            db_session, [copy.deepcopy(sample_post_data), new_post, copy.deepcopy(new_post)]
+        )
+
+        assert result == {"created": 1, "skipped": 2, "errors": []}
+        stored = crud.get_post(db_session, "new_post")
+        assert stored.risk_score == sample_post_data["risk_assessment"]["risk_score"]
+        assert stored.risk_flags == sample_post_data["risk_assessment"]["flags"]
+
+    def test_bulk_create_posts_reports_failing_rows(
+        self, db_with_user: tuple[Session, User], sample_post_data: dict
+    ):
+        """Test a failing row is reported without losing the valid rows"""
+        db_session, _ = db_with_user
+        broken_post = {**copy.deepcopy(sample_post_data), "id": "broken", "title": None}
+
+        result = crud.bulk_create_posts(db_session, [copy.deepcopy(sample_post_data), broken_post])
+
+        assert result["created"] == 1
+        assert [e["post_id"] for e in result["errors"]] == ["broken"]
+        assert crud.get_post(db_session, sample_post_data["id"]) is not None
+
+    def test_bulk_create_users(self, db_with_user: tuple[Session, User], sample_user_data: dict):
+        """Test existing users are skipped and new ones inserted"""
+        db_session, _ = db_with_user
+        new_user = {**copy.deepcopy(sample_user_data), "username": "new_user"}
+
+        result = crud.bulk_create_users(db_session, [copy.deepcopy(sample_user_data), new_user])
+
+        assert result == {"created": 1, "skipped": 1, "errors": []}
+        assert crud.get_user(db_session, "new_user") is not None
+
 
 class TestStatistics:
     """Tests for statistics function"""
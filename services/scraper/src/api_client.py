@@ -1,12 +1,54 @@
 """API client for sending scraped data to the detection API"""
+import gzip
 import logging
+import orjson
 import requests
-from typing import Any, Dict, List, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, List, Tuple, Union
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+GZIP_JSON_HEADERS = {**JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# Bodies above this size are gzipped; repetitive bulk JSON compresses several-fold
+GZIP_MIN_BYTES = 64 * 1024
+
+# Connections kept open to the API host; covers concurrent sends from one client
+POOL_MAXSIZE = 16
+
+# Connection failures are retried for every method (nothing reached the API).
+# Gateway errors are only retried where repeating the request is harmless:
+# GETs, and the bulk endpoints, which skip rows that already exist. A 5xx on
+# any other write may arrive after the row was committed.
+RETRY_POLICY = Retry(
+    total=3,
+    read=0,  # A read failure may mean the request was already applied
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+)
+BULK_RETRY_POLICY = RETRY_POLICY.new(allowed_methods=frozenset(["GET", "POST"]))
+
+
+def _encode_json_body(payload: Any) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Serialize a payload for a JSON POST, gzipping it when it is large
+
+    Args:
+        payload: JSON-serializable request payload
+
+    Returns:
+        Tuple of (body bytes, request headers)
+    """
+    body = orjson.dumps(payload)
+    if len(body) > GZIP_MIN_BYTES:
+        return gzip.compress(body, compresslevel=1), GZIP_JSON_HEADERS
+    return body, JSON_HEADERS
+
 
 class BulkResult:
     """Result from bulk API operations"""
@@ -28,23 +70,35 @@ class APIClient:
 
     def __init__(self, base_url: str = None):
         self.base_url = base_url or settings.api_url
+        self._url_health = f"{self.base_url}/health"
+        self._url_bulk_posts = f"{self.base_url}/bulk/posts"
+        self._url_bulk_users = f"{self.base_url}/bulk/users"
+        self._url_monitoring_logs_bulk = f"{self.base_url}/monitoring-logs/bulk"
         self.timeout = settings.api_timeout
         self.session = requests.Session()
 
+        # Keep warm connections to the API and retry transient failures; requests
+        # picks the longest matching prefix, so bulk URLs get the wider policy
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        bulk_adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=BULK_RETRY_POLICY)
+        self.session.mount(f"{self.base_url}/bulk/", bulk_adapter)
+
     def health_check(self) -> bool:
         """Check if the API is available"""
         try:
             response = self.session.get(
-                f"{self.base_url}/health",
+                self._url_health,
                 timeout=self.timeout
             )
             return response.status_code == 200
         except requests.RequestException as e:
-            logger.warning(f"API health check failed: {e}")
+            logger.warning("API health check failed: %s", e)
             return False
 
     def _prepare_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare post data for API submission"""
+        """Prepare post data for API submission, with risk fields flattened to DB column names"""
         risk = post.get('risk_assessment', {})
         return {
             'id': post.get('id', ''),
@@ -64,19 +118,17 @@ class APIClient:
             'spoiler': post.get('spoiler', False),
             'locked': post.get('locked', False),
             'link_flair_text': post.get('link_flair_text'),
-            'risk_assessment': {
-                'risk_score': int(risk.get('risk_score', 0)),
-                'risk_level': risk.get('risk_level', 'minimal'),
-                'hate_score': int(risk.get('hate_score', 0)),
-                'violence_score': int(risk.get('violence_score', 0)),
-                'explanation': risk.get('explanation', ''),
-                'flags': risk.get('flags', [])
-            },
+            'risk_score': int(risk.get('risk_score', 0)),
+            'risk_level': risk.get('risk_level', 'minimal'),
+            'hate_score': int(risk.get('hate_score', 0)),
+            'violence_score': int(risk.get('violence_score', 0)),
+            'risk_explanation': risk.get('explanation', ''),
+            'risk_flags': risk.get('flags', []),
             'scored_at': post.get('scored_at')
         }
 
     def _prepare_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare user data for API submission"""
+        """Prepare user data for API submission, with risk and statistics fields flattened"""
         risk = user.get('risk_assessment', {})
 
         # Map scorer field names to API schema field names
@@ -93,26 +145,21 @@ class APIClient:
             'is_gold': user.get('is_gold', False),
             'is_mod': user.get('is_mod', False),
             'has_verified_email': user.get('has_verified_email', False),
-            'risk_assessment': {
-                'risk_score': int(risk_score) if risk_score else 0,
-                'risk_level': risk.get('risk_level', 'minimal'),
-                'hate_score': int(hate_score) if hate_score else 0,
-                'violence_score': int(violence_score) if violence_score else 0,
-                'explanation': risk.get('explanation', ''),
-                'flags': risk.get('flags', [])
-            },
-            'statistics': {
-                'total_posts_analyzed': risk.get(
-                    'total_content_analyzed', user.get('total_posts_analyzed', 0)
-                ),
-                'flagged_posts_count': risk.get(
-                    'high_risk_content_count', user.get('flagged_posts_count', 0)
-                ),
-                'flagged_comments_count': user.get('flagged_comments_count', 0),
-                'avg_post_risk_score': float(risk_score) if risk_score else 0.0,
-                'avg_comment_risk_score': user.get('avg_comment_risk_score', 0.0),
-                'max_risk_score_seen': int(risk_score) if risk_score else 0
-            },
+            'risk_score': int(risk_score) if risk_score else 0,
+            'risk_level': risk.get('risk_level', 'minimal'),
+            'hate_score': int(hate_score) if hate_score else 0,
+            'violence_score': int(violence_score) if violence_score else 0,
+            'risk_explanation': risk.get('explanation', ''),
+            'total_posts_analyzed': risk.get(
+                'total_content_analyzed', user.get('total_posts_analyzed', 0)
+            ),
+            'flagged_posts_count': risk.get(
+                'high_risk_content_count', user.get('flagged_posts_count', 0)
+            ),
+            'flagged_comments_count': user.get('flagged_comments_count', 0),
+            'avg_post_risk_score': float(risk_score) if risk_score else 0.0,
+            'avg_comment_risk_score': user.get('avg_comment_risk_score', 0.0),
+            'max_risk_score_seen': int(risk_score) if risk_score else 0,
             'scored_at': risk.get('scored_at') or user.get('scored_at')
         }
 
@@ -129,23 +176,24 @@ class APIClient:
         if not posts:
             return BulkResult()
 
-        prepared = [self._prepare_post(p) for p in posts]
+        body, headers = _encode_json_body([self._prepare_post(p) for p in posts])
 
         try:
             response = self.session.post(
-                f"{self.base_url}/bulk/posts",
-                json=prepared,
+                self._url_bulk_posts,
+                data=body,
+                headers=headers,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             return BulkResult(
                 created=result.get('created', 0),
                 skipped=result.get('skipped', 0),
                 errors=len(result.get('errors', []))
             )
-        except requests.RequestException as e:
-            logger.error(f"Failed to send posts to API: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Failed to send posts to API: %s", e)
             raise
 
     def send_users(self, users: List[Dict[str, Any]]) -> BulkResult:
@@ -161,25 +209,27 @@ class APIClient:
         if not users:
             return BulkResult()
 
-        prepared = [self._prepare_user(u) for u in users]
+        body, headers = _encode_json_body([self._prepare_user(u) for u in users])
 
         try:
             response = self.session.post(
-                f"{self.base_url}/bulk/users",
-                json=prepared,
+                self._url_bulk_users,
+                data=body,
+                headers=headers,
                 timeout=self.timeout
             )
-            if response.status_code == 422:
-                logger.error(f"Validation error from API: {response.text}")
+            # Only decode the body when the message will actually be emitted
+            if response.status_code == 422 and logger.isEnabledFor(logging.ERROR):
+                logger.error("Validation error from API: %s", response.text)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             return BulkResult(
                 created=result.get('created', 0),
                 skipped=result.get('skipped', 0),
                 errors=len(result.get('errors', []))
             )
-        except requests.RequestException as e:
-            logger.error(f"Failed to send users to API: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Failed to send users to API: %s", e)
             raise
 
     def send_all(
@@ -197,8 +247,10 @@ class APIClient:
         Returns:
             SendAllResult with results for both posts and users
         """
-        posts_result = self.send_posts(posts)
-        users_result = self.send_users(users)
+        # Users go first because posts reference their authors (posts.author -> users.username);
+        # an empty side is skipped rather than sent as a no-op request
+        users_result = self.send_users(users) if users else BulkResult()
+        posts_result = self.send_posts(posts) if posts else BulkResult()
 
         return SendAllResult(posts=posts_result, users=users_result)
 
@@ -218,7 +270,7 @@ class APIClient:
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            logger.error(f"Failed to get monitored users: {e}")
+            logger.error("Failed to get monitored users: %s", e)
             return []
 
     def create_alert(self, alert: Dict[str, Any]) -> Dict[str, Any]:
@@ -240,7 +292,7 @@ class APIClient:
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            logger.error(f"Failed to create alert: {e}")
+            logger.error("Failed to create alert: %s", e)
             raise
 
     def create_monitoring_log(self, log_entry: Dict[str, Any]) -> Dict[str, Any]:
@@ -262,7 +314,35 @@ class APIClient:
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            logger.error(f"Failed to create monitoring log: {e}")
+            logger.error("Failed to create monitoring log: %s", e)
+            raise
+
+    def create_monitoring_logs(self, log_entries: List[Dict[str, Any]]) -> int:
+        """
+        Create several monitoring log entries in one request
+
+        Args:
+            log_entries: List of monitoring log data dictionaries
+
+        Returns:
+            Number of entries created
+        """
+        if not log_entries:
+            return 0
+
+        body, headers = _encode_json_body(log_entries)
+
+        try:
+            response = self.session.post(
+                self._url_monitoring_logs_bulk,
+                data=body,
+                headers=headers,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content).get('created', 0)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Failed to create monitoring logs: %s", e)
             raise
 
     def set_user_monitored(self, username: str, is_monitored: bool = True) -> Dict[str, Any]:
@@ -285,5 +365,5 @@ class APIClient:
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            logger.error(f"Failed to update user monitoring status: {e}")
+            logger.error("Failed to update user monitoring status: %s", e)
             raise
\ No newline at end of file
@@ -1,23 +1,50 @@
 """Reddit web scraper using public JSON endpoints and Beautiful Soup"""
 import requests
-import json
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+import orjson
+import math
+import threading
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Endpoint templates; query strings are passed as params so requests encodes them
+SUBREDDIT_URL = "https://www.reddit.com/r/{subreddit}/{sort}.json"
+USER_SUBMITTED_URL = "https://www.reddit.com/user/{username}/submitted.json"
+USER_COMMENTS_URL = "https://www.reddit.com/user/{username}/comments.json"
+SUBREDDIT_SEARCH_URL = "https://www.reddit.com/r/{subreddit}/search.json"
+SEARCH_URL = "https://www.reddit.com/search.json"
+
+# Retries for a request Reddit answers with 429, and the first backoff when
+# the response carries no usable Retry-After header (doubled per retry)
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 5.0
+# Upper bound on any single backoff, so a bogus Retry-After can't stall the scraper
+MAX_RATE_LIMIT_BACKOFF = RATE_LIMIT_BACKOFF * 2 ** MAX_RATE_LIMIT_RETRIES
+
+
+# The same posts recur across search terms and user histories
+@lru_cache(maxsize=4096)
+def _created_date(created_utc: float) -> str:
+    """ISO date string for a Reddit created_utc timestamp"""
+    return datetime.fromtimestamp(created_utc).isoformat()
+
 
 class RedditScraper:
     """Scraper for Reddit data using public JSON endpoints"""
 
-    def __init__(self, rate_limit_delay: float = 2.0):
+    def __init__(self, rate_limit_delay: float = 2.0, max_workers: int = 1):
         """
         Initialize the Reddit scraper
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 2.0)
+            max_workers: Subreddits fetched concurrently by iter_subreddit_posts (default: 1)
         """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
@@ -25,11 +52,50 @@ class RedditScraper:
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # One pooled connection per concurrent fetch so keep-alive survives bursts
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=max(max_workers, DEFAULT_POOLSIZE)))
         self.rate_limit_delay = rate_limit_delay
+        self.max_workers = max_workers
+        # Shared by every thread using this scraper: monotonic time the next request may go out
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
 
     def _wait(self):
-        """Rate limiting delay between requests"""
-        time.sleep(self.rate_limit_delay)
+        """Block until the next request slot, keeping all threads to one request per rate_limit_delay"""
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_request_at)
+            self._next_request_at = send_at + self.rate_limit_delay
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def _get(self, url: str, params: Dict) -> requests.Response:
+        """
+        GET a Reddit endpoint through the shared rate limiter
+
+        A 429 pushes back the shared schedule, so every thread pauses, and the
+        request is retried up to MAX_RATE_LIMIT_RETRIES times, waiting at most
+        MAX_RATE_LIMIT_BACKOFF seconds each time. The last response
+        is returned either way; callers still call raise_for_status().
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self._wait()
+            response = self.session.get(url, params=params, timeout=10)
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            try:
+                backoff = float(response.headers['Retry-After'])
+            except (KeyError, ValueError):
+                backoff = math.nan
+            if not math.isfinite(backoff):
+                backoff = RATE_LIMIT_BACKOFF * 2 ** attempt
+            backoff = min(max(backoff, 0.0), MAX_RATE_LIMIT_BACKOFF)
+            logger.warning(f"Rate limited by Reddit, retrying in {backoff:.0f}s "
+                           f"(attempt {attempt + 1}/{MAX_RATE_LIMIT_RETRIES})")
+            with self._rate_lock:
+                self._next_request_at = max(self._next_request_at, time.monotonic() + backoff)
+        return response
 
     def get_subreddit_posts(self, subreddit: str, limit: int = 100,
                            sort: str = 'new') -> List[Dict]:
@@ -45,13 +111,13 @@ class RedditScraper:
             List of post dictionaries with metadata
         """
         posts = []
-        url = f"https://www.reddit.com/r/{subreddit}/{sort}.json?limit={min(limit, 100)}"
+        url = SUBREDDIT_URL.format(subreddit=subreddit, sort=sort)
 
         try:
             logger.info(f"Fetching posts from r/{subreddit} ({sort})...")
-            response = self.session.get(url, timeout=10)
+            response = self._get(url, {'limit': min(limit, 100)})
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for post in data['data']['children']:
                 post_data = post['data']
@@ -62,7 +128,7 @@ class RedditScraper:
                     'author': post_data['author'],
                     'subreddit': post_data['subreddit'],
                     'created_utc': post_data['created_utc'],
-                    'created_date': datetime.fromtimestamp(post_data['created_utc']).isoformat(),
+                    'created_date': _created_date(post_data['created_utc']),
                     'score': post_data['score'],
                     'upvote_ratio': post_data.get('upvote_ratio', 0),
                     'num_comments': post_data['num_comments'],
@@ -77,13 +143,12 @@ class RedditScraper:
                 })
 
             logger.info(f"Successfully fetched {len(posts)} posts from r/{subreddit}")
-            self._wait()
 
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error fetching posts from r/{subreddit}: {e}")
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error fetching posts from r/{subreddit}: {e}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error from r/{subreddit}: {e}")
         except Exception as e:
             logger.error(f"Unexpected error fetching posts from r/{subreddit}: {e}")
@@ -111,14 +176,14 @@ class RedditScraper:
 
         while should_continue:
             page_count += 1
-            url = f"https://www.reddit.com/user/{username}/submitted.json?limit=100"
+            params = {'limit': 100}
             if after:
-                url += f"&after={after}"
+                params['after'] = after
 
             try:
-                response = self.session.get(url, timeout=10)
+                response = self._get(USER_SUBMITTED_URL.format(username=username), params)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 items = data['data']['children']
                 if not items:
@@ -140,7 +205,7 @@ class RedditScraper:
                         'selftext': post_data.get('selftext', ''),
                         'subreddit': post_data['subreddit'],
                         'created_utc': created_utc,
-                        'created_date': datetime.fromtimestamp(created_utc).isoformat(),
+                        'created_date': _created_date(created_utc),
                         'score': post_data['score'],
                         'num_comments': post_data['num_comments'],
                         'permalink': post_data['permalink'],
@@ -153,7 +218,6 @@ class RedditScraper:
                     break
 
                 logger.debug(f"Fetched page {page_count} for u/{username} posts (total: {len(posts)})")
-                self._wait()
 
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 404:
@@ -191,14 +255,14 @@ class RedditScraper:
 
         while should_continue:
             page_count += 1
-            url = f"https://www.reddit.com/user/{username}/comments.json?limit=100"
+            params = {'limit': 100}
             if after:
-                url += f"&after={after}"
+                params['after'] = after
 
             try:
-                response = self.session.get(url, timeout=10)
+                response = self._get(USER_COMMENTS_URL.format(username=username), params)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 items = data['data']['children']
                 if not items:
@@ -219,7 +283,7 @@ class RedditScraper:
                         'body': comment_data['body'],
                         'subreddit': comment_data['subreddit'],
                         'created_utc': created_utc,
-                        'created_date': datetime.fromtimestamp(created_utc).isoformat(),
+                        'created_date': _created_date(created_utc),
                         'score': comment_data['score'],
                         'permalink': comment_data['permalink'],
                         'link_title': comment_data.get('link_title', ''),
@@ -232,7 +296,6 @@ class RedditScraper:
                     break
 
                 logger.debug(f"Fetched page {page_count} for u/{username} comments (total: {len(comments)})")
-                self._wait()
 
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 404:
@@ -295,15 +358,17 @@ class RedditScraper:
         posts = []
 
         if subreddit:
-            url = f"https://www.reddit.com/r/{subreddit}/search.json?q={query}&restrict_sr=1&limit={min(limit, 100)}&sort=new"
+            url = SUBREDDIT_SEARCH_URL.format(subreddit=subreddit)
+            params = {'q': query, 'restrict_sr': 1, 'limit': min(limit, 100), 'sort': 'new'}
         else:
-            url = f"https://www.reddit.com/search.json?q={query}&limit={min(limit, 100)}&sort=new"
+            url = SEARCH_URL
+            params = {'q': query, 'limit': min(limit, 100), 'sort': 'new'}
 
         try:
             logger.info(f"Searching for: '{query}'" + (f" in r/{subreddit}" if subreddit else ""))
-            response = self.session.get(url, timeout=10)
+            response = self._get(url, params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for post in data['data']['children']:
                 post_data = post['data']
@@ -314,7 +379,7 @@ class RedditScraper:
                     'author': post_data['author'],
                     'subreddit': post_data['subreddit'],
                     'created_utc': post_data['created_utc'],
-                    'created_date': datetime.fromtimestamp(post_data['created_utc']).isoformat(),
+                    'created_date': _created_date(post_data['created_utc']),
                     'score': post_data['score'],
                     'num_comments': post_data['num_comments'],
                     'permalink': post_data['permalink'],
@@ -323,13 +388,32 @@ class RedditScraper:
                 })
 
             logger.info(f"Found {len(posts)} posts matching '{query}'")
-            self._wait()
 
         except Exception as e:
             logger.error(f"Error searching for '{query}': {e}")
 
         return posts
 
+    def iter_subreddit_posts(self, subreddits: List[str],
+                             posts_per_subreddit: int = 50) -> Iterator[List[Dict]]:
+        """
+        Yield each subreddit's posts as soon as that subreddit has been fetched
+
+        Args:
+            subreddits: List of subreddit names
+            posts_per_subreddit: Number of posts to fetch per subreddit
+
+        Yields:
+            One list of posts per subreddit, in the order given
+        """
+        # Workers overlap network latency, but every request still waits on the
+        # scraper's shared limiter, so the overall rate does not grow with max_workers
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(
+                lambda subreddit: self.get_subreddit_posts(subreddit, limit=posts_per_subreddit),
+                subreddits
+            )
+
     def collect_from_multiple_subreddits(self, subreddits: List[str],
                                         posts_per_subreddit: int = 50) -> List[Dict]:
         """
@@ -344,9 +428,8 @@ class RedditScraper:
         """
         all_posts = []
 
-        for subreddit in subreddits:
-            posts = self.get_subreddit_posts(subreddit, limit=posts_per_subreddit)
+        for posts in self.iter_subreddit_posts(subreddits, posts_per_subreddit):
             all_posts.extend(posts)
             logger.info(f"Progress: {len(all_posts)} total posts collected")
 
-        return all_posts
\ No newline at end of file
+        return all_posts
@@ -4,6 +4,7 @@ from enum import StrEnum
 from functools import cached_property
 from pathlib import Path
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -44,6 +45,7 @@ class Settings(BaseSettings):
     posts_per_search: int = 25
 
     user_history_days: int = 60
+    user_history_cache_ttl: int = 3600  # Seconds to reuse a fetched user history (0 disables)
 
     @cached_property
     def subreddits_list(self) -> list[str]:
@@ -84,6 +86,7 @@ class Settings(BaseSettings):
     # API settings (for sending data to API service)
     api_url: str = "http://localhost:8000"
     api_timeout: int = 30
+    api_batch_size: int = Field(default=100, gt=0)  # Max posts/users per bulk request
 
     def get_log_level_int(self) -> int:
         """Get logging level as integer"""
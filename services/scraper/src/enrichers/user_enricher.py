@@ -1,10 +1,19 @@
 """User data enrichment module"""
+from bisect import bisect_right
+import heapq
 import logging
-from typing import Dict, List
-from datetime import datetime, timedelta
+import sys
+from typing import Dict, List, Optional
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 86400
+
+# Recent-activity counts where the profile status moves up a level
+ACTIVITY_THRESHOLDS = (10, 50)
+ACTIVITY_STATUSES = ("low_activity", "moderate_activity", "high_activity")
+
 
 class UserEnricher:
     """Enriches user data with additional metadata and analysis"""
@@ -17,56 +26,52 @@ class UserEnricher:
             user_history_days: Number of days to consider for recent activity (default: 60)
         """
         self.user_history_days = user_history_days
-        self.history_cutoff = (datetime.now() - timedelta(days=user_history_days)).timestamp()
 
-    def enrich_user_data(self, user_data: Dict) -> Dict:
+    def enrich_user_data(self, user_data: Dict, now: Optional[datetime] = None,
+                         timestamp: Optional[str] = None) -> Dict:
         """
         Enrich user data with calculated metrics
 
         Args:
             user_data: Raw user data from scraper
+            now: Reference time for the history window and timestamp (default: current time)
+            timestamp: Preformatted ISO string for now (default: formatted here)
 
         Returns:
             Enriched user data with additional metrics
         """
+        now = now or datetime.now()
+        cutoff = now.timestamp() - self.user_history_days * SECONDS_PER_DAY
         username = user_data.get('username', 'unknown')
         posts = user_data.get('posts', [])
         comments = user_data.get('comments', [])
 
-        # Filter to recent history based on configured days
-        recent_posts = [p for p in posts if p.get('created_utc', 0) >= self.history_cutoff]
-        recent_comments = [c for c in comments if c.get('created_utc', 0) >= self.history_cutoff]
+        # Filter to recent history based on configured days, gathering scores,
+        # subreddits and text in the same pass over each list
+        recent_posts, post_score_sum, subreddits_posted, post_text = self._scan_recent(
+            posts, cutoff, ('title', 'selftext'))
+        recent_comments, comment_score_sum, subreddits_commented, comment_text = self._scan_recent(
+            comments, cutoff, ('body',))
 
         # Calculate activity metrics
         total_activity = len(recent_posts) + len(recent_comments)
 
         # Calculate average scores
-        avg_post_score = sum(p.get('score', 0) for p in recent_posts) / len(recent_posts) if recent_posts else 0
-        avg_comment_score = sum(c.get('score', 0) for c in recent_comments) / len(recent_comments) if recent_comments else 0
+        avg_post_score = post_score_sum / len(recent_posts) if recent_posts else 0
+        avg_comment_score = comment_score_sum / len(recent_comments) if recent_comments else 0
 
         # Get unique subreddits
-        subreddits_posted = set(p.get('subreddit', '') for p in recent_posts)
-        subreddits_commented = set(c.get('subreddit', '') for c in recent_comments)
-        unique_subreddits = subreddits_posted.union(subreddits_commented)
+        unique_subreddits = subreddits_posted | subreddits_commented
 
         # Calculate activity frequency (posts/comments per day)
         activity_per_day = total_activity / self.user_history_days if self.user_history_days > 0 else 0
 
         # Collect all text content for later scoring
-        all_text = []
-        for post in recent_posts:
-            if post.get('title'):
-                all_text.append(post['title'])
-            if post.get('selftext'):
-                all_text.append(post['selftext'])
-
-        for comment in recent_comments:
-            if comment.get('body'):
-                all_text.append(comment['body'])
+        all_text = post_text + comment_text
 
         enriched_data = {
             'username': username,
-            'enrichment_timestamp': datetime.now().isoformat(),
+            'enrichment_timestamp': timestamp or now.isoformat(),
             'activity_metrics': {
                 'total_posts': len(posts),
                 'total_comments': len(comments),
@@ -79,9 +84,9 @@ class UserEnricher:
             },
             'subreddit_diversity': {
                 'unique_subreddits_count': len(unique_subreddits),
-                'subreddits': sorted(list(unique_subreddits)),
-                'primary_subreddits_posted': sorted(list(subreddits_posted))[:10],
-                'primary_subreddits_commented': sorted(list(subreddits_commented))[:10],
+                'subreddits': sorted(unique_subreddits),
+                'primary_subreddits_posted': heapq.nsmallest(10, subreddits_posted),
+                'primary_subreddits_commented': heapq.nsmallest(10, subreddits_commented),
             },
             'content': {
                 'all_text': all_text,
@@ -99,18 +104,39 @@ class UserEnricher:
 
         return enriched_data
 
+    def _scan_recent(self, items: List[Dict], cutoff: float, text_fields: tuple) -> tuple:
+        """
+        Filter items to the history window in one pass
+
+        Args:
+            items: Posts or comments from the scraper
+            cutoff: Unix timestamp where the history window starts
+            text_fields: Fields holding text to collect, in order
+
+        Returns:
+            Tuple of (recent items, score sum, subreddits, non-empty texts)
+        """
+        recent = []
+        score_sum = 0
+        subreddits = set()
+        texts = []
+
+        for item in items:
+            if item.get('created_utc', 0) < cutoff:
+                continue
+            recent.append(item)
+            score_sum += item.get('score', 0)
+            # Decoded JSON gives every item its own copy of the name
+            subreddits.add(sys.intern(item.get('subreddit') or ''))
+            texts.extend(filter(None, map(item.get, text_fields)))
+
+        return recent, score_sum, subreddits, texts
+
     def _determine_profile_status(self, total_activity: int, posts: List, comments: List) -> str:
         """Determine the status of a user's profile"""
-        if total_activity == 0 and (not posts and not comments):
-            return "new_user_no_activity"
-        elif total_activity == 0 and (posts or comments):
-            return "no_recent_activity"
-        elif total_activity < 10:
-            return "low_activity"
-        elif total_activity < 50:
-            return "moderate_activity"
-        else:
-            return "high_activity"
+        if total_activity == 0:
+            return "no_recent_activity" if posts or comments else "new_user_no_activity"
+        return ACTIVITY_STATUSES[bisect_right(ACTIVITY_THRESHOLDS, total_activity)]
 
     def enrich_multiple_users(self, users_data: List[Dict]) -> List[Dict]:
         """
@@ -123,10 +149,13 @@ class UserEnricher:
             List of enriched user data dictionaries
         """
         enriched_users = []
+        # One reference time so the whole batch shares a window and timestamp
+        now = datetime.now()
+        timestamp = now.isoformat()
 
         for user_data in users_data:
             try:
-                enriched = self.enrich_user_data(user_data)
+                enriched = self.enrich_user_data(user_data, now=now, timestamp=timestamp)
                 enriched_users.append(enriched)
             except Exception as e:
                 username = user_data.get('username', 'unknown')
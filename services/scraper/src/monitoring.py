@@ -35,10 +35,15 @@ class UserMonitor:
             logger.error(f"Failed to fetch monitored users: {e}")
             return []
 
-    def scan_user(self, username: str) -> Dict[str, Any]:
+    def scan_user(self, username: str, log_activity: bool = True) -> Dict[str, Any]:
         """
         Scan a single user for new content and assess risk.
 
+        Args:
+            username: Reddit username to scan
+            log_activity: Send the monitoring log entry right away; batch callers
+                pass False and log completed scans themselves
+
         Returns:
             Dictionary with scan results including any alerts generated
         """
@@ -94,7 +99,8 @@ class UserMonitor:
                     result['alerts_generated'].append(alert)
 
             # Log monitoring activity
-            self._log_monitoring_activity(username, result)
+            if log_activity:
+                self._log_monitoring_activity(username, result)
 
             logger.info(f"  u/{username}: Scanned {result['new_posts_count']} posts, "
                        f"{result['new_comments_count']} comments, "
@@ -135,9 +141,9 @@ class UserMonitor:
 
         return alert
 
-    def _log_monitoring_activity(self, username: str, result: Dict) -> None:
-        """Log monitoring activity to API"""
-        log_entry = {
+    def _build_log_entry(self, username: str, result: Dict) -> Dict[str, Any]:
+        """Build the monitoring log entry for a scan result"""
+        return {
             'username': username,
             'activity_type': 'daily_scan',
             'description': f"Daily monitoring scan for u/{username}",
@@ -151,11 +157,20 @@ class UserMonitor:
             }
         }
 
+    def _log_monitoring_activity(self, username: str, result: Dict) -> None:
+        """Log monitoring activity to API"""
         try:
-            self.api_client.create_monitoring_log(log_entry)
+            self.api_client.create_monitoring_log(self._build_log_entry(username, result))
         except Exception as e:
             logger.error(f"Failed to log monitoring activity for u/{username}: {e}")
 
+    def _log_monitoring_activities(self, log_entries: List[Dict[str, Any]]) -> None:
+        """Log a whole run's monitoring activity to API in one request"""
+        try:
+            self.api_client.create_monitoring_logs(log_entries)
+        except Exception as e:
+            logger.error(f"Failed to log monitoring activity for {len(log_entries)} users: {e}")
+
     def run_daily_monitoring(self) -> Dict[str, Any]:
         """
         Run daily monitoring scan for all flagged users.
@@ -185,6 +200,7 @@ class UserMonitor:
 
         # Scan each monitored user
         results = []
+        log_entries = []
         total_alerts = 0
         high_risk_users = []
 
@@ -192,8 +208,11 @@ class UserMonitor:
             username = user.get('username') if isinstance(user, dict) else user
             logger.info(f"\n[{i}/{len(monitored_users)}] Scanning u/{username}...")
 
-            result = self.scan_user(username)
+            result = self.scan_user(username, log_activity=False)
             results.append(result)
+            # Only completed scans are logged, matching scan_user's own logging
+            if result['status'] == 'success':
+                log_entries.append(self._build_log_entry(username, result))
 
             alerts_count = len(result.get('alerts_generated', []))
             total_alerts += alerts_count
@@ -205,6 +224,9 @@ class UserMonitor:
                     'alerts': alerts_count
                 })
 
+        # One insert for the whole run instead of one commit per user
+        self._log_monitoring_activities(log_entries)
+
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
 
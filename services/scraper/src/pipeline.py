@@ -1,24 +1,33 @@
 """Complete data processing pipeline: collect -> enrich -> score"""
 import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from src.collectors.reddit_scraper import RedditScraper
 from src.enrichers.user_enricher import UserEnricher
 from src.scorers.hate_speech_scorer import HateSpeechScorer
-from src.api_client import APIClient
+from src.api_client import APIClient, BulkResult
 from src.monitoring import UserMonitor
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Placeholder and bot accounts that are never worth enriching
+SKIP_AUTHORS = frozenset(('[deleted]', 'AutoModerator', '[removed]'))
+
 
 class DataPipeline:
     """Complete data processing pipeline"""
 
     def __init__(self):
-        self.scraper = RedditScraper(rate_limit_delay=2.0)
+        self.scraper = RedditScraper(rate_limit_delay=2.0,
+                                     max_workers=settings.max_concurrent_requests)
         self.enricher = UserEnricher(user_history_days=settings.user_history_days)
         self.scorer = HateSpeechScorer()
         self.api_client = APIClient()
+        # username -> (monotonic fetch time, history); reused across runs within the TTL
+        self._history_cache = {}
 
 
     def run_full_pipeline(self, subreddits: list, posts_per_subreddit: int = 25,
@@ -38,54 +47,81 @@ class DataPipeline:
         logger.info("STARTING DATA PROCESSING PIPELINE")
         logger.info("=" * 80)
 
-        # Step 1a: Collect posts from subreddits
-        logger.info(f"\n[STEP 1/5] Collecting posts from {len(subreddits)} subreddits...")
-        all_posts = self.scraper.collect_from_multiple_subreddits(
-            subreddits=subreddits,
-            posts_per_subreddit=posts_per_subreddit
-        )
-        logger.info(f"Collected {len(all_posts)} posts from subreddits")
-
-        # Step 1b: Collect posts using search terms
-        if search_terms:
-            logger.info(f"\n[STEP 1b/5] Searching for posts with {len(search_terms)} search terms...")
-            seen_ids = {p['id'] for p in all_posts}
-            for term in search_terms:
-                search_results = self.scraper.search_posts(query=term, limit=posts_per_search)
-                # Deduplicate - only add posts we haven't seen
-                new_posts = [p for p in search_results if p['id'] not in seen_ids]
-                for p in new_posts:
-                    seen_ids.add(p['id'])
+        # Step 2 runs on a single background worker: each subreddit's posts and each
+        # search batch are scored as soon as they arrive, overlapping with the
+        # rate-limited requests still in flight
+        all_posts = []
+        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=1) as scoring_executor:
+            scoring_futures = []
+
+            def queue_new_posts(posts):
+                """Keep posts not seen yet, submit them for scoring and return them"""
+                # Overlapping subreddits and search results can return the same post
+                new_posts = []
+                for post in posts:
+                    if post['id'] not in seen_ids:
+                        seen_ids.add(post['id'])
+                        new_posts.append(post)
                 all_posts.extend(new_posts)
-                logger.info(f"  Search '{term}': found {len(search_results)} posts, {len(new_posts)} new")
-            logger.info(f"Total posts after search: {len(all_posts)}")
-
-        # Step 2: Score posts
-        logger.info(f"\n[STEP 2/5] Scoring {len(all_posts)} posts for hate speech and violence...")
-        scored_posts = self.scorer.score_multiple_posts(all_posts)
+                if new_posts:
+                    scoring_futures.append(
+                        scoring_executor.submit(self.scorer.score_multiple_posts, new_posts)
+                    )
+                return new_posts
+
+            # Step 1a: Collect posts from subreddits
+            logger.info(f"\n[STEP 1/5] Collecting posts from {len(subreddits)} subreddits...")
+            for posts in self.scraper.iter_subreddit_posts(
+                subreddits=subreddits,
+                posts_per_subreddit=posts_per_subreddit
+            ):
+                new_posts = queue_new_posts(posts)
+                if len(new_posts) < len(posts):
+                    logger.debug(f"Dropped {len(posts) - len(new_posts)} duplicate posts")
+            logger.info(f"Collected {len(all_posts)} posts from subreddits")
+
+            # Step 1b: Collect posts using search terms
+            if search_terms:
+                logger.info(f"\n[STEP 1b/5] Searching for posts with {len(search_terms)} search terms...")
+                for term in search_terms:
+                    search_results = self.scraper.search_posts(query=term, limit=posts_per_search)
+                    new_posts = queue_new_posts(search_results)
+                    logger.info(f"  Search '{term}': found {len(search_results)} posts, {len(new_posts)} new")
+                logger.info(f"Total posts after search: {len(all_posts)}")
+
+            # Step 2: Score posts
+            logger.info(f"\n[STEP 2/5] Scoring {len(all_posts)} posts for hate speech and violence...")
+            scored_posts = [post for future in scoring_futures for post in future.result()]
 
         # Filter to keep only posts with controversial, harmful, or violent content (risk_score > 0)
         scored_posts = [p for p in scored_posts
                         if p['risk_assessment']['risk_score'] > 0]
         logger.info(f"Filtered to {len(scored_posts)} posts with harmful/violent content")
 
-        # Filter high-risk posts
-        high_risk_posts = [p for p in scored_posts
-                          if p['risk_assessment']['risk_score'] >= 50]
+        # Split out high-risk posts and collect authors from harmful posts in one pass;
+        # dicts keep authors in post order so the enrichment selection is deterministic
+        high_risk_posts = []
+        unique_authors = {}
+        high_risk_authors = {}
+        for post in scored_posts:
+            is_high_risk = post['risk_assessment']['risk_score'] >= 50
+            if is_high_risk:
+                high_risk_posts.append(post)
+            author = post['author']
+            if author in SKIP_AUTHORS:
+                continue
+            unique_authors[author] = None
+            # Prioritize authors from high-risk posts
+            if is_high_risk:
+                high_risk_authors[author] = None
         logger.info(f"Found {len(high_risk_posts)} high-risk posts")
 
 
         # Step 3: Extract authors from harmful posts only
         logger.info(f"\n[STEP 3/5] Extracting authors from harmful content posts...")
-        # Only consider authors from posts with harmful content (scored_posts already filtered)
-        unique_authors = set(post['author'] for post in scored_posts
-                           if post['author'] not in ['[deleted]', 'AutoModerator', '[removed]'])
         logger.info(f"Found {len(unique_authors)} unique authors from harmful content")
 
-        # Prioritize authors from high-risk posts
-        high_risk_authors = set(p['author'] for p in high_risk_posts
-                              if p['author'] not in ['[deleted]', 'AutoModerator', '[removed]'])
-
         # Select users to enrich (prioritize high-risk authors)
         users_to_enrich = list(high_risk_authors)[:max_users_to_enrich]
         remaining_slots = max_users_to_enrich - len(users_to_enrich)
@@ -102,10 +138,16 @@ class DataPipeline:
         raw_user_data = []
         skipped_users = 0
 
-        for i, username in enumerate(users_to_enrich, 1):
-            logger.info(f"  Processing user {i}/{len(users_to_enrich)}: u/{username}")
-            user_history = self.scraper.get_user_history(username, user_history_days=settings.user_history_days)
+        self._prune_history_cache()
+
+        # History fetches are I/O bound; run up to max_concurrent_requests at once while the
+        # scraper's shared limiter keeps the combined Reddit request rate unchanged
+        logger.info(f"  Fetching history for {len(users_to_enrich)} users "
+                   f"({settings.max_concurrent_requests} concurrent requests)")
+        with ThreadPoolExecutor(max_workers=settings.max_concurrent_requests) as executor:
+            histories = list(executor.map(self._fetch_user_history, users_to_enrich))
 
+        for username, user_history in zip(users_to_enrich, histories, strict=True):
             # Skip users with no content (new users, private profiles, deleted accounts)
             if user_history['total_posts'] == 0 and user_history['total_comments'] == 0:
                 logger.warning(f"  Skipping u/{username}: no posts or comments (new user, private, or deleted)")
@@ -134,12 +176,8 @@ class DataPipeline:
                          reverse=True)
 
         # Count risk levels
-        risk_distribution = {
-            'critical': 0, 'high': 0, 'medium': 0, 'low': 0, 'minimal': 0
-        }
-        for user in scored_users:
-            risk_level = user['risk_assessment']['risk_level']
-            risk_distribution[risk_level] = risk_distribution.get(risk_level, 0) + 1
+        risk_distribution = dict.fromkeys(('critical', 'high', 'medium', 'low', 'minimal'), 0)
+        risk_distribution.update(Counter(u['risk_assessment']['risk_level'] for u in scored_users))
 
         logger.info(f"User risk distribution: {risk_distribution}")
 
@@ -169,6 +207,27 @@ class DataPipeline:
             'users': scored_users,
         }
 
+    def _fetch_user_history(self, username: str) -> dict:
+        """Fetch one user's history, reusing a non-empty cached copy younger than the TTL"""
+        ttl = settings.user_history_cache_ttl
+        cached = self._history_cache.get(username)
+        if cached and time.monotonic() - cached[0] < ttl:
+            logger.debug("  Using cached history for u/%s", username)
+            return cached[1]
+
+        logger.debug("  Processing user u/%s", username)
+        history = self.scraper.get_user_history(username, user_history_days=settings.user_history_days)
+        # An empty history may be a transient failure (e.g. rate limiting), so retry it next run
+        if ttl > 0 and (history['total_posts'] or history['total_comments']):
+            self._history_cache[username] = (time.monotonic(), history)
+        return history
+
+    def _prune_history_cache(self):
+        """Drop cached user histories older than the TTL"""
+        cutoff = time.monotonic() - settings.user_history_cache_ttl
+        self._history_cache = {u: entry for u, entry in self._history_cache.items()
+                               if entry[0] >= cutoff}
+
     def _send_to_api(self, scored_posts, scored_users):
         """Send scored data to the API"""
         try:
@@ -179,18 +238,18 @@ class DataPipeline:
 
             logger.info("API connection verified")
 
+            # Send users first: posts reference their authors (posts.author -> users.username)
+            logger.info(f"Sending {len(scored_users)} users to API...")
+            users_result = self._send_in_batches(self.api_client.send_users, scored_users)
+            logger.info(f"Users: {users_result.created} created, "
+                        f"{users_result.skipped} skipped, {users_result.errors} errors")
+
             # Send posts
             logger.info(f"Sending {len(scored_posts)} posts to API...")
-            posts_result = self.api_client.send_posts(scored_posts)
+            posts_result = self._send_in_batches(self.api_client.send_posts, scored_posts)
             logger.info(f"Posts: {posts_result.created} created, "
                         f"{posts_result.skipped} skipped, {posts_result.errors} errors")
 
-            # Send users
-            logger.info(f"Sending {len(scored_users)} users to API...")
-            users_result = self.api_client.send_users(scored_users)
-            logger.info(f"Users: {users_result.created} created, "
-                        f"{users_result.skipped} skipped, {users_result.errors} errors")
-
             logger.info("=" * 80)
             logger.info("API EXPORT COMPLETED!")
             logger.info("=" * 80)
@@ -198,6 +257,34 @@ class DataPipeline:
         except Exception as e:
             logger.error(f"API export failed: {e}", exc_info=True)
 
+    def _send_in_batches(self, send, items) -> BulkResult:
+        """
+        Send items through a bulk endpoint in chunks of settings.api_batch_size,
+        keeping up to settings.max_concurrent_requests chunks in flight
+
+        Args:
+            send: Bulk send method (e.g. api_client.send_posts)
+            items: List of items to send
+
+        Returns:
+            BulkResult with counts summed over all batches
+        """
+        total = BulkResult()
+        batch_size = settings.api_batch_size
+        batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=settings.max_concurrent_requests) as executor:
+                results = list(executor.map(send, batches))
+        else:
+            results = [send(batch) for batch in batches]
+
+        for result in results:
+            total.created += result.created
+            total.skipped += result.skipped
+            total.errors += result.errors
+        return total
+
     def _log_summary_report(self, all_posts, scored_posts, high_risk_posts,
                            scored_users, risk_distribution):
         """Log summary report to console"""
@@ -1,13 +1,39 @@
 """Risk scoring module for hate speech and violent content detection"""
+import hashlib
 import logging
 import re
 import json
+import threading
+from collections import OrderedDict
 from typing import Dict, List
 from datetime import datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+EXCLAMATION_PATTERN = re.compile(r'[!]{3,}')
+
+# Texts whose scores are remembered; hot listings repeat across pipeline runs
+SCORE_CACHE_SIZE = 10_000
+
+
+def _compile_keyword_buckets(keywords_by_severity: Dict[str, List[str]]) -> Dict:
+    """
+    Compile keyword lists into regex patterns once
+
+    Each severity bucket gets a single alternation pattern used as a cheap
+    gate (no keyword in the bucket can match if it does not), plus one
+    pattern per keyword so matches are still flagged individually.
+    """
+    compiled = {}
+    for severity, keywords in keywords_by_severity.items():
+        if not keywords:
+            continue
+        gate = re.compile(r'\b(?:' + '|'.join(re.escape(k) for k in keywords) + r')\b')
+        patterns = [(k, re.compile(r'\b' + re.escape(k) + r'\b')) for k in keywords]
+        compiled[severity] = (gate, patterns)
+    return compiled
+
 
 class HateSpeechScorer:
     """
@@ -46,6 +72,15 @@ class HateSpeechScorer:
         self.slur_patterns = lexicon.get('slur_patterns', [])
         self.context_indicators = lexicon.get('context_indicators', {})
 
+        # Precompile patterns so score_text does not rebuild them per call
+        self._hate_patterns = _compile_keyword_buckets(self.hate_keywords)
+        self._violence_patterns = _compile_keyword_buckets(self.violence_keywords)
+        self._slur_regexes = [re.compile(p, re.IGNORECASE) for p in self.slur_patterns]
+        # Text digest -> score_text result, least recently used first; the lock
+        # keeps threads sharing this scorer from reordering it mid-update
+        self._score_cache = OrderedDict()
+        self._score_cache_lock = threading.Lock()
+
         logger.info(f"Loaded HurtLex-based lexicon from {lexicon_path}")
         logger.info(f"  - Hate keywords: {sum(len(v) for v in self.hate_keywords.values())} total")
         logger.info(f"  - Violence keywords: {sum(len(v) for v in self.violence_keywords.values())} total")
@@ -73,15 +108,35 @@ class HateSpeechScorer:
                 'flags': []
             }
 
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self._score_cache_lock:
+            result = self._score_cache.get(key)
+            if result is not None:
+                self._score_cache.move_to_end(key)
+        if result is None:
+            # Analyze outside the lock; two threads racing on one text just store equal results
+            result = self._analyze_text(text)
+            with self._score_cache_lock:
+                self._score_cache[key] = result
+                if len(self._score_cache) > SCORE_CACHE_SIZE:
+                    self._score_cache.popitem(last=False)
+
+        # Callers own the returned dict, so hand out a copy of the cached one
+        return {**result, 'flags': list(result['flags'])}
+
+    def _analyze_text(self, text: str) -> Dict:
+        """Run the lexicon checks on non-empty text"""
         text_lower = text.lower()
         flags = []
         hate_score = 0
         violence_score = 0
 
         # Check for hate keywords
-        for severity, keywords in self.hate_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
+        for severity, (gate, patterns) in self._hate_patterns.items():
+            if not gate.search(text_lower):
+                continue
+            for keyword, pattern in patterns:
+                if pattern.search(text_lower):
                     if severity == 'extreme':
                         hate_score += 30
                         flags.append(f"Extreme hate keyword: '{keyword}'")
@@ -93,9 +148,11 @@ class HateSpeechScorer:
                         flags.append(f"Medium hate keyword: '{keyword}'")
 
         # Check for violence keywords
-        for severity, keywords in self.violence_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
+        for severity, (gate, patterns) in self._violence_patterns.items():
+            if not gate.search(text_lower):
+                continue
+            for keyword, pattern in patterns:
+                if pattern.search(text_lower):
                     if severity == 'extreme':
                         violence_score += 30
                         flags.append(f"Extreme violence keyword: '{keyword}'")
@@ -107,13 +164,13 @@ class HateSpeechScorer:
                         flags.append(f"Medium violence keyword: '{keyword}'")
 
         # Check for slur patterns
-        for pattern in self.slur_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for pattern in self._slur_regexes:
+            if pattern.search(text_lower):
                 hate_score += 40
                 flags.append("Slur or derogatory term detected")
 
         # Check for multiple exclamation/caps (aggressive tone)
-        if re.search(r'[!]{3,}', text):
+        if EXCLAMATION_PATTERN.search(text):
             hate_score += 5
             flags.append("Aggressive tone (excessive exclamation)")
 
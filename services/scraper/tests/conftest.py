@@ -1,9 +1,12 @@
 """Test fixtures and configuration for scraper tests"""
-import pytest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+import copy
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 
 
 @pytest.fixture
@@ -102,51 +105,51 @@ def sample_user_comments_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_raw_user_data():
-    """Sample raw user data from scraper"""
+    """Sample raw user data from scraper (read-only, shared across the session)"""
     now = datetime.now()
     recent_timestamp = (now - timedelta(days=30)).timestamp()
     old_timestamp = (now - timedelta(days=90)).timestamp()
 
-    return {
+    return MappingProxyType({
         "username": "test_user",
-        "posts": [
-            {
+        "posts": (
+            MappingProxyType({
                 "id": "post1",
                 "title": "Recent Post",
                 "selftext": "Recent content",
                 "subreddit": "subreddit_a",
                 "created_utc": recent_timestamp,
                 "score": 100,
-            },
-            {
+            }),
+            MappingProxyType({
                 "id": "post2",
                 "title": "Old Post",
                 "selftext": "Old content",
                 "subreddit": "subreddit_b",
                 "created_utc": old_timestamp,
                 "score": 50,
-            },
-        ],
-        "comments": [
-            {
+            }),
+        ),
+        "comments": (
+            MappingProxyType({
                 "id": "comment1",
                 "body": "Recent comment",
                 "subreddit": "subreddit_a",
                 "created_utc": recent_timestamp,
                 "score": 10,
-            },
-            {
+            }),
+            MappingProxyType({
                 "id": "comment2",
                 "body": "Old comment",
                 "subreddit": "subreddit_c",
                 "created_utc": old_timestamp,
                 "score": 5,
-            },
-        ],
+            }),
+        ),
         "fetched_at": now.isoformat(),
-    }
+    })
 
 
 @pytest.fixture
@@ -225,10 +228,10 @@ def sample_high_risk_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_post():
-    """Sample post dictionary"""
-    return {
+    """Sample post mapping (read-only, shared across the session)"""
+    return MappingProxyType({
         "id": "test_post_123",
         "title": "Test Post Title",
         "selftext": "This is the body content of the post",
@@ -245,7 +248,7 @@ def sample_post():
         "over_18": False,
         "spoiler": False,
         "locked": False,
-    }
+    })
 
 
 @pytest.fixture
@@ -337,3 +340,114 @@ def mock_api_response():
         "skipped": 2,
         "errors": [],
     }
+
+
+# Baseline return values for UserMonitor collaborators; tests override what differs
+BASELINE_USER_HISTORY = {
+    "username": "test",
+    "total_posts": 1,
+    "total_comments": 1,
+    "posts": [],
+    "comments": [],
+}
+BASELINE_ENRICHED_USER = {
+    "username": "test",
+    "content": {"all_text": ["Test content"]},
+}
+BASELINE_SCORED_USER = {
+    "username": "test",
+    "risk_assessment": {"overall_risk_score": 20},
+}
+BASELINE_TEXT_SCORE = {
+    "risk_score": 10,
+    "risk_level": "low",
+    "flags": [],
+}
+
+
+@pytest.fixture
+def monitoring_mocks(monkeypatch):
+    """Patch UserMonitor's collaborators with mocks preset to the baseline returns"""
+    mocks = SimpleNamespace(
+        scraper=Mock(),
+        enricher=Mock(),
+        scorer=Mock(),
+        api=Mock(),
+    )
+    # Copies, so a test that mutates a return value cannot leak into the next one
+    mocks.scraper.get_user_history.return_value = copy.deepcopy(BASELINE_USER_HISTORY)
+    mocks.enricher.enrich_user_data.return_value = copy.deepcopy(BASELINE_ENRICHED_USER)
+    mocks.scorer.score_user.return_value = copy.deepcopy(BASELINE_SCORED_USER)
+    mocks.scorer.score_text.return_value = copy.deepcopy(BASELINE_TEXT_SCORE)
+
+    monkeypatch.setattr("src.monitoring.RedditScraper", lambda *args, **kwargs: mocks.scraper)
+    monkeypatch.setattr("src.monitoring.UserEnricher", lambda *args, **kwargs: mocks.enricher)
+    monkeypatch.setattr("src.monitoring.HateSpeechScorer", lambda *args, **kwargs: mocks.scorer)
+    monkeypatch.setattr("src.monitoring.APIClient", lambda *args, **kwargs: mocks.api)
+    return mocks
+
+
+@pytest.fixture
+def make_monitor(monitoring_mocks):
+    """Factory for UserMonitor instances built on the patched collaborators"""
+    from src.monitoring import UserMonitor
+
+    return lambda **kwargs: UserMonitor(**kwargs)
+
+
+@pytest.fixture
+def monitor(make_monitor):
+    """UserMonitor with default thresholds and mocked collaborators"""
+    return make_monitor()
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """Replace the run loop's sleep so it raises KeyboardInterrupt after the first run"""
+    sleep = Mock(side_effect=KeyboardInterrupt)
+    monkeypatch.setattr("src.main.time.sleep", sleep)
+    return sleep
+
+
+@pytest.fixture
+def pipeline_mock(monkeypatch):
+    """Patch src.main.DataPipeline and return the instance run() will use"""
+    pipeline = Mock()
+    monkeypatch.setattr("src.main.DataPipeline", lambda *args, **kwargs: pipeline)
+    return pipeline
+
+
+@pytest.fixture
+def pipeline_mocks(monkeypatch):
+    """Patch DataPipeline's collaborators; the API client defaults to healthy and accepting"""
+    import src.pipeline as pipeline_module
+    from src.api_client import APIClient, BulkResult
+    from src.collectors.reddit_scraper import RedditScraper
+    from src.enrichers.user_enricher import UserEnricher
+    from src.scorers.hate_speech_scorer import HateSpeechScorer
+
+    # Spec'd mocks reject attributes the real classes don't have
+    mocks = SimpleNamespace(
+        scraper=Mock(spec=RedditScraper),
+        enricher=Mock(spec=UserEnricher),
+        scorer=Mock(spec=HateSpeechScorer),
+        api=Mock(spec=APIClient),
+    )
+    mocks.scraper.iter_subreddit_posts.return_value = []
+    mocks.api.health_check.return_value = True
+    mocks.api.send_posts.return_value = BulkResult(created=1)
+    mocks.api.send_users.return_value = BulkResult(created=1)
+
+    monkeypatch.setattr(pipeline_module, "RedditScraper", lambda *args, **kwargs: mocks.scraper)
+    monkeypatch.setattr(pipeline_module, "UserEnricher", lambda *args, **kwargs: mocks.enricher)
+    monkeypatch.setattr(pipeline_module, "HateSpeechScorer", lambda *args, **kwargs: mocks.scorer)
+    monkeypatch.setattr(pipeline_module, "APIClient", lambda *args, **kwargs: mocks.api)
+    return mocks
+
+
+@pytest.fixture
+def pipeline(pipeline_mocks):
+    """DataPipeline built on the patched collaborators"""
+    from src.pipeline import DataPipeline
+
+    return DataPipeline()
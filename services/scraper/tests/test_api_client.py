@@ -1,7 +1,10 @@
 """Tests for APIClient"""
 import pytest
+import gzip
+import json
 import responses
 from unittest.mock import patch, MagicMock
+from requests.exceptions import HTTPError
 
 from src.api_client import APIClient, BulkResult, SendAllResult
 
@@ -93,14 +96,63 @@ class TestHealthCheck:
         client = APIClient(base_url="http://test-api:8000")
         assert client.health_check() is False
 
+    @patch("urllib3.util.retry.time.sleep")
     @patch("src.api_client.settings")
-    def test_health_check_connection_error(self, mock_settings):
+    def test_health_check_connection_error(self, mock_settings, mock_sleep):
         """Test health check with connection error"""
         mock_settings.api_timeout = 30
 
         client = APIClient(base_url="http://nonexistent-host:9999")
         # This should return False due to connection error
         assert client.health_check() is False
+        # Connection errors are retried with backoff before giving up
+        assert mock_sleep.called
+
+    @patch("urllib3.util.retry.time.sleep")
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_health_check_retries_gateway_errors(self, mock_settings, mock_sleep):
+        """Test a transient 503 is retried on the pooled session"""
+        responses.add(responses.GET, "http://test-api:8000/health", status=503)
+        responses.add(responses.GET, "http://test-api:8000/health", json={"status": "healthy"}, status=200)
+
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+        assert client.health_check() is True
+        assert len(responses.calls) == 2
+
+    @patch("urllib3.util.retry.time.sleep")
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_bulk_send_retries_gateway_errors(self, mock_settings, mock_sleep):
+        """Test bulk upserts are retried on a 503 since existing rows are skipped"""
+        responses.add(responses.POST, "http://test-api:8000/bulk/users", status=503)
+        responses.add(
+            responses.POST, "http://test-api:8000/bulk/users",
+            json={"created": 1, "skipped": 0, "errors": []}, status=201,
+        )
+
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+        assert client.send_users([{"username": "user1"}]).created == 1
+        assert len(responses.calls) == 2
+
+    @patch("urllib3.util.retry.time.sleep")
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_create_alert_not_retried_on_gateway_error(self, mock_settings, mock_sleep):
+        """Test a 504 on a plain write is not repeated, since the row may already exist"""
+        responses.add(responses.POST, "http://test-api:8000/alerts", status=504)
+        responses.add(responses.POST, "http://test-api:8000/alerts", json={"id": 1}, status=201)
+
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+        with pytest.raises(HTTPError):
+            client.create_alert({"username": "user1"})
+        assert len(responses.calls) == 1
 
 
 class TestPreparePost:
@@ -116,8 +168,8 @@ class TestPreparePost:
 
         assert prepared["id"] == sample_scored_post["id"]
         assert prepared["title"] == sample_scored_post["title"]
-        assert prepared["risk_assessment"]["risk_score"] == 15
-        assert prepared["risk_assessment"]["risk_level"] == "low"
+        assert prepared["risk_score"] == 15
+        assert prepared["risk_level"] == "low"
 
     @patch("src.api_client.settings")
     def test_prepare_post_missing_fields(self, mock_settings):
@@ -130,7 +182,7 @@ class TestPreparePost:
 
         assert prepared["id"] == "test"
         assert prepared["title"] == ""
-        assert prepared["risk_assessment"]["risk_score"] == 0
+        assert prepared["risk_score"] == 0
 
     @patch("src.api_client.settings")
     def test_prepare_post_converts_scores_to_int(self, mock_settings):
@@ -148,9 +200,9 @@ class TestPreparePost:
         }
         prepared = client._prepare_post(post)
 
-        assert prepared["risk_assessment"]["risk_score"] == 15
-        assert prepared["risk_assessment"]["hate_score"] == 10
-        assert prepared["risk_assessment"]["violence_score"] == 5
+        assert prepared["risk_score"] == 15
+        assert prepared["hate_score"] == 10
+        assert prepared["violence_score"] == 5
 
 
 class TestPrepareUser:
@@ -165,8 +217,8 @@ class TestPrepareUser:
         prepared = client._prepare_user(sample_scored_user)
 
         assert prepared["username"] == sample_scored_user["username"]
-        assert prepared["risk_assessment"]["risk_score"] == 25
-        assert prepared["risk_assessment"]["risk_level"] == "low"
+        assert prepared["risk_score"] == 25
+        assert prepared["risk_level"] == "low"
 
     @patch("src.api_client.settings")
     def test_prepare_user_maps_field_names(self, mock_settings):
@@ -185,9 +237,9 @@ class TestPrepareUser:
         }
         prepared = client._prepare_user(user)
 
-        assert prepared["risk_assessment"]["risk_score"] == 50
-        assert prepared["risk_assessment"]["hate_score"] == 30
-        assert prepared["risk_assessment"]["violence_score"] == 20
+        assert prepared["risk_score"] == 50
+        assert prepared["hate_score"] == 30
+        assert prepared["violence_score"] == 20
 
     @patch("src.api_client.settings")
     def test_prepare_user_missing_fields(self, mock_settings):
@@ -199,8 +251,8 @@ class TestPrepareUser:
         prepared = client._prepare_user(minimal_user)
 
         assert prepared["username"] == "test"
-        assert prepared["risk_assessment"]["risk_score"] == 0
-        assert prepared["statistics"]["total_posts_analyzed"] == 0
+        assert prepared["risk_score"] == 0
+        assert prepared["total_posts_analyzed"] == 0
 
 
 class TestSendPosts:
@@ -226,6 +278,27 @@ class TestSendPosts:
         assert result.skipped == 2
         assert result.errors == 0
 
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_send_posts_sends_json_body(self, mock_settings, sample_scored_post, mock_api_response):
+        """Test posts are serialized to a JSON request body"""
+        responses.add(
+            responses.POST,
+            "http://test-api:8000/bulk/posts",
+            json=mock_api_response,
+            status=200,
+        )
+
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+        client.send_posts([sample_scored_post])
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        body = json.loads(request.body)
+        assert [p["id"] for p in body] == [sample_scored_post["id"]]
+
     @patch("src.api_client.settings")
     @responses.activate
     def test_send_posts_empty_list(self, mock_settings):
@@ -256,6 +329,45 @@ class TestSendPosts:
         with pytest.raises(Exception):
             client.send_posts([sample_scored_post])
 
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_send_posts_gzips_large_body(self, mock_settings, sample_scored_post, mock_api_response):
+        """Test bodies above GZIP_MIN_BYTES are sent gzip-encoded"""
+        responses.add(
+            responses.POST,
+            "http://test-api:8000/bulk/posts",
+            json=mock_api_response,
+            status=200,
+        )
+        mock_settings.api_timeout = 30
+        posts = [{**sample_scored_post, "id": f"post{i}"} for i in range(500)]
+
+        client = APIClient(base_url="http://test-api:8000")
+        client.send_posts(posts)
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert len(json.loads(gzip.decompress(request.body))) == 500
+
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_send_posts_small_body_not_gzipped(self, mock_settings, sample_scored_post, mock_api_response):
+        """Test small bodies are sent as plain JSON"""
+        responses.add(
+            responses.POST,
+            "http://test-api:8000/bulk/posts",
+            json=mock_api_response,
+            status=200,
+        )
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+        client.send_posts([sample_scored_post])
+
+        request = responses.calls[0].request
+        assert "Content-Encoding" not in request.headers
+        assert json.loads(request.body)[0]["id"] == sample_scored_post["id"]
+
 
 class TestSendUsers:
     """Tests for send_users method"""
@@ -351,3 +463,76 @@ class TestSendAll:
 
         assert result.posts.created == 0
         assert result.users.created == 0
+
+    @patch("src.api_client.settings")
+    def test_send_all_skips_empty_side(self, mock_settings):
+        """Test only the non-empty side is sent"""
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+        with patch.object(client, "send_posts", return_value=BulkResult(created=1)) as send_posts, \
+                patch.object(client, "send_users") as send_users:
+            result = client.send_all([{"id": "p1"}], [])
+
+        send_posts.assert_called_once_with([{"id": "p1"}])
+        send_users.assert_not_called()
+        assert result.posts.created == 1
+        assert result.users.created == 0
+
+    @patch("src.api_client.settings")
+    def test_send_all_sends_users_before_posts(self, mock_settings):
+        """Test users are stored before the posts that reference them"""
+        mock_settings.api_timeout = 30
+        order = []
+
+        def recorder(side):
+            def send(items):
+                order.append(side)
+                return BulkResult(created=len(items))
+            return send
+
+        client = APIClient(base_url="http://test-api:8000")
+        with patch.object(client, "send_posts", side_effect=recorder("posts")), \
+                patch.object(client, "send_users", side_effect=recorder("users")):
+            result = client.send_all([{"id": "p1"}, {"id": "p2"}], [{"username": "u1"}])
+
+        assert order == ["users", "posts"]
+        assert result.posts.created == 2
+        assert result.users.created == 1
+
+
+class TestCreateMonitoringLogs:
+    """Tests for create_monitoring_logs method"""
+
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_create_monitoring_logs_single_request(self, mock_settings):
+        """Test all entries are sent in one bulk request"""
+        responses.add(
+            responses.POST,
+            "http://test-api:8000/monitoring-logs/bulk",
+            json={"created": 2},
+            status=201,
+        )
+        mock_settings.api_timeout = 30
+        entries = [
+            {"username": "user1", "activity_type": "daily_scan"},
+            {"username": "user2", "activity_type": "daily_scan"},
+        ]
+
+        client = APIClient(base_url="http://test-api:8000")
+
+        assert client.create_monitoring_logs(entries) == 2
+        assert len(responses.calls) == 1
+        assert json.loads(responses.calls[0].request.body) == entries
+
+    @patch("src.api_client.settings")
+    @responses.activate
+    def test_create_monitoring_logs_empty(self, mock_settings):
+        """Test no request is made without entries"""
+        mock_settings.api_timeout = 30
+
+        client = APIClient(base_url="http://test-api:8000")
+
+        assert client.create_monitoring_logs([]) == 0
+        assert len(responses.calls) == 0
@@ -1,11 +1,105 @@
 """Tests for configuration management"""
-import pytest
 import logging
-from unittest.mock import patch, MagicMock
-from pathlib import Path
 import os
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import LogLevel, Settings, setup_logging
+
+DEFAULT_SETTINGS = {
+    "log_level": LogLevel.INFO,
+    "rate_limit_delay": 2.0,
+    "request_timeout": 10,
+    "posts_per_subreddit": 10,
+    "max_users_to_enrich": 20,
+    "user_history_days": 60,
+    "user_history_cache_ttl": 3600,
+    "critical_risk_threshold": 70,
+    "high_risk_threshold": 50,
+    "medium_risk_threshold": 30,
+    "low_risk_threshold": 10,
+    "save_raw_data": True,
+    "save_processed_data": True,
+    "generate_reports": True,
+    "output_format": "json",
+    "max_concurrent_requests": 5,
+    "max_memory_mb": 2048,
+    "debug_mode": False,
+    "max_retries": 3,
+    "retry_delay": 5,
+    "min_post_length": 10,
+    "filter_bots": True,
+    "filter_deleted": True,
+    "api_url": "http://localhost:8000",
+    "api_timeout": 30,
+    "api_batch_size": 100,
+}
+
+# Environment datasets as (name, value) pairs; patch.dict accepts these directly
+ENV_OVERRIDES = (
+    ("LOG_LEVEL", "DEBUG"),
+    ("RATE_LIMIT_DELAY", "3.5"),
+    ("POSTS_PER_SUBREDDIT", "50"),
+    ("API_URL", "http://example.com:8080"),
+)
+
+UNKNOWN_ENV = (
+    ("SOME_UNKNOWN_VAR", "value"),
+    ("ANOTHER_UNKNOWN", "123"),
+)
+
+CUSTOM_THRESHOLDS_ENV = (
+    ("CRITICAL_RISK_THRESHOLD", "80"),
+    ("HIGH_RISK_THRESHOLD", "60"),
+    ("MEDIUM_RISK_THRESHOLD", "40"),
+    ("LOW_RISK_THRESHOLD", "20"),
+)
+
+OUTPUT_SETTINGS_ENV = (
+    ("SAVE_RAW_DATA", "false"),
+    ("SAVE_PROCESSED_DATA", "false"),
+    ("GENERATE_REPORTS", "false"),
+    ("OUTPUT_FORMAT", "csv"),
+)
+
+LOG_LEVEL_CASES = (
+    ("DEBUG", logging.DEBUG),
+    ("INFO", logging.INFO),
+    ("WARNING", logging.WARNING),
+    ("ERROR", logging.ERROR),
+)
+
+
+class InfoCounter:
+    """Minimal logger stand-in that only counts info() calls"""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def info(self, *args, **kwargs):
+        self.count += 1
+
+
+@pytest.fixture(scope="session")
+def logging_setup(tmp_path_factory):
+    """Run setup_logging once in a scratch directory and share the result"""
+    log_root = tmp_path_factory.mktemp("logging")
+    original_cwd = os.getcwd()
+    os.chdir(log_root)
+
+    try:
+        with patch("src.config.settings") as mock_settings:
+            mock_settings.get_log_level_int.return_value = logging.INFO
+            mock_settings.log_level = LogLevel.INFO
+            logger = setup_logging()
+    finally:
+        os.chdir(original_cwd)
 
-from src.config import Settings, LogLevel, setup_logging
+    return logger, log_root
 
 
 class TestLogLevelEnum:
@@ -28,28 +122,12 @@ class TestSettings:
         with patch.dict(os.environ, {}, clear=True):
             settings = Settings()
 
-            assert settings.log_level == LogLevel.INFO
-            assert settings.rate_limit_delay == 2.0
-            assert settings.request_timeout == 10
-            assert settings.posts_per_subreddit == 10
-            assert settings.max_users_to_enrich == 20
-            assert settings.user_history_days == 60
-            assert settings.critical_risk_threshold == 70
-            assert settings.high_risk_threshold == 50
-            assert settings.medium_risk_threshold == 30
-            assert settings.low_risk_threshold == 10
-            assert settings.api_url == "http://localhost:8000"
-            assert settings.api_timeout == 30
+            for field, expected in DEFAULT_SETTINGS.items():
+                assert getattr(settings, field) == expected, field
 
     def test_settings_from_env(self):
         """Test settings can be loaded from environment variables"""
-        env_vars = {
-            "LOG_LEVEL": "DEBUG",
-            "RATE_LIMIT_DELAY": "3.5",
-            "POSTS_PER_SUBREDDIT": "50",
-            "API_URL": "http://example.com:8080",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
+        with patch.dict(os.environ, ENV_OVERRIDES, clear=True):
             settings = Settings()
 
             assert settings.log_level == LogLevel.DEBUG
@@ -79,85 +157,50 @@ class TestSettings:
             result = settings.search_terms_list
             assert result == ["term1", "term2", "term3"]
 
-    def test_get_log_level_int_debug(self):
-        """Test get_log_level_int returns correct int for DEBUG"""
-        with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}, clear=True):
-            settings = Settings()
-            assert settings.get_log_level_int() == logging.DEBUG
-
-    def test_get_log_level_int_info(self):
-        """Test get_log_level_int returns correct int for INFO"""
-        with patch.dict(os.environ, {"LOG_LEVEL": "INFO"}, clear=True):
-            settings = Settings()
-            assert settings.get_log_level_int() == logging.INFO
-
-    def test_get_log_level_int_warning(self):
-        """Test get_log_level_int returns correct int for WARNING"""
-        with patch.dict(os.environ, {"LOG_LEVEL": "WARNING"}, clear=True):
-            settings = Settings()
-            assert settings.get_log_level_int() == logging.WARNING
-
-    def test_get_log_level_int_error(self):
-        """Test get_log_level_int returns correct int for ERROR"""
-        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}, clear=True):
+    @pytest.mark.parametrize("level_name,expected", LOG_LEVEL_CASES)
+    def test_get_log_level_int(self, level_name, expected):
+        """Test get_log_level_int returns correct int for each level"""
+        with patch.dict(os.environ, {"LOG_LEVEL": level_name}, clear=True):
             settings = Settings()
-            assert settings.get_log_level_int() == logging.ERROR
+            assert settings.get_log_level_int() == expected
 
-    def test_print_config(self, caplog):
+    def test_print_config(self):
         """Test print_config logs configuration"""
         settings = Settings()
-        mock_logger = MagicMock()
+        counter = InfoCounter()
 
-        settings.print_config(mock_logger)
+        settings.print_config(counter)
 
         # Verify logger.info was called multiple times
-        assert mock_logger.info.call_count >= 5
+        assert counter.count >= 5
 
     def test_settings_extra_ignored(self):
         """Test that extra env vars are ignored"""
-        env_vars = {
-            "SOME_UNKNOWN_VAR": "value",
-            "ANOTHER_UNKNOWN": "123",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
+        with patch.dict(os.environ, UNKNOWN_ENV, clear=True):
             # Should not raise error
             settings = Settings()
             assert settings is not None
 
+    @pytest.mark.parametrize("batch_size", ["0", "-5"])
+    def test_api_batch_size_must_be_positive(self, batch_size):
+        """Test a non-positive API batch size is rejected"""
+        with patch.dict(os.environ, {"API_BATCH_SIZE": batch_size}, clear=True):
+            with pytest.raises(ValidationError):
+                Settings()
+
 
 class TestSetupLogging:
     """Tests for setup_logging function"""
 
-    @patch("src.config.settings")
-    def test_setup_logging_creates_logs_dir(self, mock_settings, tmp_path):
+    def test_setup_logging_creates_logs_dir(self, logging_setup):
         """Test setup_logging creates logs directory"""
-        mock_settings.get_log_level_int.return_value = logging.INFO
-        mock_settings.log_level = LogLevel.INFO
-
-        # Change to temp directory
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            logger = setup_logging()
-            assert Path("logs").exists()
-        finally:
-            os.chdir(original_cwd)
+        _, log_root = logging_setup
+        assert (log_root / "logs").exists()
 
-    @patch("src.config.settings")
-    def test_setup_logging_returns_logger(self, mock_settings, tmp_path):
+    def test_setup_logging_returns_logger(self, logging_setup):
         """Test setup_logging returns a logger"""
-        mock_settings.get_log_level_int.return_value = logging.INFO
-        mock_settings.log_level = LogLevel.INFO
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            logger = setup_logging()
-            assert isinstance(logger, logging.Logger)
-        finally:
-            os.chdir(original_cwd)
+        logger, _ = logging_setup
+        assert isinstance(logger, logging.Logger)
 
 
 class TestRiskThresholds:
@@ -173,13 +216,7 @@ class TestRiskThresholds:
 
     def test_custom_thresholds_from_env(self):
         """Test custom thresholds from environment"""
-        env_vars = {
-            "CRITICAL_RISK_THRESHOLD": "80",
-            "HIGH_RISK_THRESHOLD": "60",
-            "MEDIUM_RISK_THRESHOLD": "40",
-            "LOW_RISK_THRESHOLD": "20",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
+        with patch.dict(os.environ, CUSTOM_THRESHOLDS_ENV, clear=True):
             settings = Settings()
 
             assert settings.critical_risk_threshold == 80
@@ -191,49 +228,12 @@ class TestRiskThresholds:
 class TestOutputSettings:
     """Tests for output settings"""
 
-    def test_default_output_settings(self):
-        """Test default output settings"""
-        settings = Settings()
-
-        assert settings.save_raw_data is True
-        assert settings.save_processed_data is True
-        assert settings.generate_reports is True
-        assert settings.output_format == "json"
-
     def test_output_settings_from_env(self):
         """Test output settings from environment"""
-        env_vars = {
-            "SAVE_RAW_DATA": "false",
-            "SAVE_PROCESSED_DATA": "false",
-            "GENERATE_REPORTS": "false",
-            "OUTPUT_FORMAT": "csv",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
+        with patch.dict(os.environ, OUTPUT_SETTINGS_ENV, clear=True):
             settings = Settings()
 
             assert settings.save_raw_data is False
             assert settings.save_processed_data is False
             assert settings.generate_reports is False
             assert settings.output_format == "csv"
-
-
-class TestPerformanceSettings:
-    """Tests for performance settings"""
-
-    def test_default_performance_settings(self):
-        """Test default performance settings"""
-        settings = Settings()
-
-        assert settings.max_concurrent_requests == 5
-        assert settings.max_memory_mb == 2048
-        assert settings.debug_mode is False
-        assert settings.max_retries == 3
-        assert settings.retry_delay == 5
-
-    def test_content_filtering_settings(self):
-        """Test content filtering settings"""
-        settings = Settings()
-
-        assert settings.min_post_length == 10
-        assert settings.filter_bots is True
-        assert settings.filter_deleted is True
\ No newline at end of file
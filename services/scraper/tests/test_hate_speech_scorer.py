@@ -2,6 +2,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from src.scorers.hate_speech_scorer import HateSpeechScorer
 
@@ -85,6 +86,17 @@ class TestScoreText:
         assert result["violence_score"] == 30
         assert "Extreme violence keyword" in result["flags"][0]
 
+    def test_score_text_flags_each_keyword_in_bucket(self, mock_lexicon):
+        """Test that every matching keyword in a severity bucket is counted"""
+        scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
+
+        result = scorer.score_text("kill and murder")
+        assert result["violence_score"] == 60
+        assert result["flags"] == [
+            "Extreme violence keyword: 'kill'",
+            "Extreme violence keyword: 'murder'",
+        ]
+
     def test_score_text_slur_pattern(self, mock_lexicon):
         """Test scoring text with slur patterns"""
         scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
@@ -147,6 +159,41 @@ class TestScoreText:
         assert result["violence_score"] > 0
         assert result["risk_score"] == result["hate_score"] + result["violence_score"]
 
+    def test_score_text_repeated_text_analyzed_once(self, mock_lexicon):
+        """Test repeated text is served from the score cache"""
+        scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
+
+        with patch.object(scorer, "_analyze_text", wraps=scorer._analyze_text) as analyze:
+            first = scorer.score_text("I will attack")
+            first["flags"].append("mutated by caller")
+            second = scorer.score_text("I will attack")
+
+        assert analyze.call_count == 1
+        assert "mutated by caller" not in second["flags"]
+        assert second["risk_score"] == first["risk_score"]
+
+    def test_score_text_cache_is_bounded(self, mock_lexicon):
+        """Test the least recently used score is evicted past the cache size"""
+        scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
+
+        with patch("src.scorers.hate_speech_scorer.SCORE_CACHE_SIZE", 2):
+            for text in ("first text", "second text", "third text"):
+                scorer.score_text(text)
+
+        assert len(scorer._score_cache) == 2
+
+    def test_score_text_cache_shared_across_threads(self, mock_lexicon):
+        """Test concurrent callers keep the cache consistent and bounded"""
+        scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
+        texts = [f"I will attack target {i % 50}" for i in range(2000)]
+
+        with patch("src.scorers.hate_speech_scorer.SCORE_CACHE_SIZE", 10):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(scorer.score_text, texts))
+
+        assert all(result["violence_score"] > 0 for result in results)
+        assert len(scorer._score_cache) <= 10
+
 
 class TestGetRiskLevel:
     """Tests for _get_risk_level method"""
@@ -302,8 +349,7 @@ class TestScoreMultiple:
         """Test scoring multiple posts"""
         scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
 
-        posts = [sample_post, sample_post.copy()]
-        posts[1]["id"] = "different_id"
+        posts = [dict(sample_post), {**sample_post, "id": "different_id"}]
 
         scored = scorer.score_multiple_posts(posts)
 
@@ -321,8 +367,7 @@ class TestScoreMultiple:
         """Test scoring multiple users"""
         scorer = HateSpeechScorer(lexicon_path=str(mock_lexicon))
 
-        users = [sample_enriched_user_data, sample_enriched_user_data.copy()]
-        users[1]["username"] = "different_user"
+        users = [sample_enriched_user_data, {**sample_enriched_user_data, "username": "different_user"}]
 
         scored = scorer.score_multiple_users(users)
 
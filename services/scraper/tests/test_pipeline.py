@@ -1,17 +1,98 @@
 """Tests for DataPipeline"""
+import time
+import threading
 import pytest
-from unittest.mock import patch, MagicMock, call
+from types import MappingProxyType
+from unittest.mock import Mock
 
+import src.pipeline as pipeline_module
 from src.pipeline import DataPipeline
 from src.api_client import BulkResult
-
+from src.config import settings
+
+# Safe for xdist: module constants are never mutated and settings changes go through monkeypatch
+pytestmark = pytest.mark.usefixtures("pipeline_mocks")
+
+
+# Pipeline scenarios: collected posts, scorer output per post and per user.
+# Only posts with risk_score > 0 are kept, so every author below needs risk_score > 0.
+_BASIC_POSTS = (
+    {"id": "post1", "author": "user1", "title": "Test", "selftext": "Content"},
+)
+_BASIC_SCORED_POSTS = (
+    {"id": "post1", "author": "user1", "risk_assessment": {"risk_score": 10}},
+)
+_BASIC_SCORED_USERS = (
+    {"username": "user1", "risk_assessment": {"overall_risk_score": 5, "risk_level": "minimal"}},
+)
+
+_FILTER_POSTS = (
+    {"id": "post1", "author": "[deleted]", "title": "Test"},
+    {"id": "post2", "author": "AutoModerator", "title": "Test"},
+    {"id": "post3", "author": "real_user", "title": "Test"},
+)
+_FILTER_SCORED_POSTS = (
+    {"id": "post1", "author": "[deleted]", "risk_assessment": {"risk_score": 10}},
+    {"id": "post2", "author": "AutoModerator", "risk_assessment": {"risk_score": 10}},
+    {"id": "post3", "author": "real_user", "risk_assessment": {"risk_score": 10}},
+)
+_FILTER_SCORED_USERS = (
+    {"username": "real_user", "risk_assessment": {"overall_risk_score": 0, "risk_level": "minimal"}},
+)
+
+_PRIORITY_POSTS = (
+    {"id": "post1", "author": "low_risk_user", "title": "Normal post"},
+    {"id": "post2", "author": "high_risk_user", "title": "Risky post"},
+)
+_PRIORITY_SCORED_POSTS = (
+    {
+        "id": "post1",
+        "author": "low_risk_user",
+        "title": "Normal post",
+        "subreddit": "test",
+        "risk_assessment": {"risk_score": 10, "risk_level": "low", "hate_score": 5, "violence_score": 5, "flags": []},
+    },
+    {
+        "id": "post2",
+        "author": "high_risk_user",
+        "title": "Risky post",
+        "subreddit": "test",
+        "risk_assessment": {"risk_score": 70, "risk_level": "critical", "hate_score": 40, "violence_score": 30, "flags": ["hate"]},
+    },
+)
+_PRIORITY_SCORED_USERS = (
+    {"username": "high_risk_user", "risk_assessment": {"overall_risk_score": 70, "risk_level": "critical"}},
+)
+
+
+_USER_HISTORY_STUB = MappingProxyType(
+    {"posts": [], "comments": [], "total_posts": 1, "total_comments": 1}
+)
+_EMPTY_MONITORING_SUMMARY = MappingProxyType({"users_scanned": 0, "total_alerts_generated": 0})
+
+# Bulk results are only read by the pipeline, so one instance per count is shared
+_BULK_3 = BulkResult(created=3)
+_BULK_5 = BulkResult(created=5)
+
+_SEND_POSTS = ({"id": "post1"},)
+_SEND_USERS = ({"username": "user1"},)
+
+_SUMMARY_ALL_POSTS = ({"id": "1"}, {"id": "2"})
+_SUMMARY_SCORED_POSTS = (
+    {"id": "1", "risk_assessment": {"risk_score": 10}},
+    {"id": "2", "risk_assessment": {"risk_score": 60}},
+)
+_SUMMARY_SCORED_USERS = (
+    {"username": "user1", "risk_assessment": {"overall_risk_score": 50, "risk_level": "high"}},
+)
+_SUMMARY_RISK_DISTRIBUTION = MappingProxyType(
+    {"critical": 0, "high": 1, "medium": 0, "low": 0, "minimal": 0}
+)
 
 class TestDataPipelineInit:
     """Tests for DataPipeline initialization"""
 
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    def test_init_creates_components(self, MockScorer, MockAPIClient, mock_lexicon):
+    def test_init_creates_components(self, mock_lexicon):
         """Test that pipeline initializes all components"""
         pipeline = DataPipeline()
 
@@ -22,325 +103,287 @@ class TestDataPipelineInit:
 class TestRunFullPipeline:
     """Tests for run_full_pipeline method"""
 
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_run_full_pipeline_basic(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
-        """Test basic pipeline execution"""
-        # Setup mocks
-        mock_scraper = MagicMock()
-        mock_scraper.collect_from_multiple_subreddits.return_value = [
-            {
-                "id": "post1",
-                "author": "user1",
-                "title": "Test",
-                "selftext": "Content",
-            }
-        ]
-        mock_scraper.get_user_history.return_value = {
-            "username": "user1",
+    @pytest.mark.parametrize(
+        "posts_in,scored_posts,scored_users,max_users,expected_username,expected_users",
+        [
+            (_BASIC_POSTS, _BASIC_SCORED_POSTS, _BASIC_SCORED_USERS, 5, "user1", ["user1"]),
+            # Only real_user should be enriched (not [deleted] or AutoModerator)
+            (_FILTER_POSTS, _FILTER_SCORED_POSTS, _FILTER_SCORED_USERS, 10, "real_user", []),
+            # With a limit of 1 user, the high-risk author is enriched first
+            (_PRIORITY_POSTS, _PRIORITY_SCORED_POSTS, _PRIORITY_SCORED_USERS, 1, "high_risk_user", ["high_risk_user"]),
+        ],
+        ids=["basic", "filters_special_authors", "prioritizes_high_risk"],
+    )
+    def test_run_full_pipeline(self, pipeline, pipeline_mocks, posts_in, scored_posts, scored_users,
+                               max_users, expected_username, expected_users):
+        """Test pipeline execution, author filtering and high-risk prioritization"""
+        pipeline_mocks.scraper.iter_subreddit_posts.return_value = [posts_in]
+        pipeline_mocks.scraper.get_user_history.return_value = {
+            "username": expected_username,
             "posts": [],
             "comments": [],
             "total_posts": 1,
             "total_comments": 1,
         }
-        MockScraper.return_value = mock_scraper
-
-        mock_enricher = MagicMock()
-        mock_enricher.enrich_multiple_users.return_value = [
-            {
-                "username": "user1",
-                "content": {"all_text": []},
-            }
-        ]
-        MockEnricher.return_value = mock_enricher
-
-        mock_scorer = MagicMock()
-        mock_scorer.score_multiple_posts.return_value = [
-            {
-                "id": "post1",
-                "author": "user1",
-                "risk_assessment": {"risk_score": 10},
-            }
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = [
+            {"username": expected_username, "content": {"all_text": []}}
         ]
-        mock_scorer.score_multiple_users.return_value = [
-            {
-                "username": "user1",
-                "risk_assessment": {
-                    "overall_risk_score": 5,
-                    "risk_level": "minimal",
-                },
-            }
-        ]
-        MockScorer.return_value = mock_scorer
-
-        mock_api_client = MagicMock()
-        mock_api_client.health_check.return_value = True
-        mock_api_client.send_posts.return_value = BulkResult(created=1)
-        mock_api_client.send_users.return_value = BulkResult(created=1)
-        MockAPIClient.return_value = mock_api_client
+        pipeline_mocks.scorer.score_multiple_posts.return_value = scored_posts
+        pipeline_mocks.scorer.score_multiple_users.return_value = scored_users
 
-        # Run pipeline
-        pipeline = DataPipeline()
         result = pipeline.run_full_pipeline(
             subreddits=["test"],
             posts_per_subreddit=10,
-            max_users_to_enrich=5,
+            max_users_to_enrich=max_users,
         )
 
-        # Verify results
-        assert "posts" in result
-        assert "users" in result
-        assert len(result["posts"]) == 1
-        assert len(result["users"]) == 1
-
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_run_full_pipeline_filters_special_authors(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
-        """Test that deleted/bot authors are filtered"""
-        # Setup mocks
-        mock_scraper = MagicMock()
-        mock_scraper.collect_from_multiple_subreddits.return_value = [
-            {"id": "post1", "author": "[deleted]", "title": "Test"},
-            {"id": "post2", "author": "AutoModerator", "title": "Test"},
-            {"id": "post3", "author": "real_user", "title": "Test"},
+        pipeline_mocks.scraper.get_user_history.assert_called_once_with(
+            expected_username, user_history_days=settings.user_history_days
+        )
+        assert result["posts"] == list(scored_posts)
+        assert [u["username"] for u in result["users"]] == expected_users
+
+    def test_run_full_pipeline_selects_authors_in_post_order(self, pipeline, pipeline_mocks):
+        """Test the enrichment selection keeps the first high-risk authors by post order"""
+        authors = [f"user{i}" for i in range(6)]
+        posts = [{"id": f"post{i}", "author": a, "title": "Test", "subreddit": "test"}
+                 for i, a in enumerate(authors)]
+        pipeline_mocks.scraper.iter_subreddit_posts.return_value = [posts]
+        # Odd-numbered authors wrote high-risk posts
+        pipeline_mocks.scorer.score_multiple_posts.return_value = [
+            {**p, "risk_assessment": {**_PRIORITY_SCORED_POSTS[i % 2]["risk_assessment"]}}
+            for i, p in enumerate(posts)
         ]
-        mock_scraper.get_user_history.return_value = {
-            "username": "real_user",
-            "posts": [],
-            "comments": [],
-            "total_posts": 1,
-            "total_comments": 1,
-        }
-        MockScraper.return_value = mock_scraper
+        pipeline_mocks.scraper.get_user_history.side_effect = (
+            lambda user, **kwargs: {"username": user, **_USER_HISTORY_STUB}
+        )
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = []
+        pipeline_mocks.scorer.score_multiple_users.return_value = []
 
-        mock_enricher = MagicMock()
-        mock_enricher.enrich_multiple_users.return_value = [
-            {"username": "real_user", "content": {"all_text": []}}
-        ]
-        MockEnricher.return_value = mock_enricher
-
-        mock_scorer = MagicMock()
-        # Note: only posts with risk_score > 0 are kept, so real_user needs risk_score > 0
-        mock_scorer.score_multiple_posts.return_value = [
-            {"id": "post1", "author": "[deleted]", "risk_assessment": {"risk_score": 10}},
-            {"id": "post2", "author": "AutoModerator", "risk_assessment": {"risk_score": 10}},
-            {"id": "post3", "author": "real_user", "risk_assessment": {"risk_score": 10}},
-        ]
-        mock_scorer.score_multiple_users.return_value = [
-            {
-                "username": "real_user",
-                "risk_assessment": {"overall_risk_score": 0, "risk_level": "minimal"},
-            }
-        ]
-        MockScorer.return_value = mock_scorer
+        pipeline.run_full_pipeline(subreddits=["test"], max_users_to_enrich=4)
 
-        mock_api_client = MagicMock()
-        mock_api_client.health_check.return_value = True
-        mock_api_client.send_posts.return_value = BulkResult(created=3)
-        mock_api_client.send_users.return_value = BulkResult(created=1)
-        MockAPIClient.return_value = mock_api_client
+        fetched = {c.args[0] for c in pipeline_mocks.scraper.get_user_history.call_args_list}
+        assert fetched == {"user1", "user3", "user5", "user0"}
 
-        # Run pipeline
-        pipeline = DataPipeline()
-        result = pipeline.run_full_pipeline(
-            subreddits=["test"],
-            posts_per_subreddit=10,
-            max_users_to_enrich=10,
-        )
+    def test_run_full_pipeline_scores_each_post_once(self, pipeline, pipeline_mocks):
+        """Test duplicate posts from overlapping subreddits are dropped before scoring"""
+        pipeline_mocks.scraper.iter_subreddit_posts.return_value = [_BASIC_POSTS, _BASIC_POSTS]
+        pipeline_mocks.scorer.score_multiple_posts.return_value = []
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = []
+        pipeline_mocks.scorer.score_multiple_users.return_value = []
 
-        # Only real_user should be enriched (not [deleted] or AutoModerator)
-        assert mock_scraper.get_user_history.call_count == 1
-        # Check that real_user was called (ignoring the user_history_days kwarg)
-        call_args = mock_scraper.get_user_history.call_args
-        assert call_args[0][0] == "real_user"
-
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_run_full_pipeline_prioritizes_high_risk_authors(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
-        """Test that high-risk authors are prioritized for enrichment"""
-        # Setup mocks
-        mock_scraper = MagicMock()
-        mock_scraper.collect_from_multiple_subreddits.return_value = [
-            {"id": "post1", "author": "low_risk_user", "title": "Normal post"},
-            {"id": "post2", "author": "high_risk_user", "title": "Risky post"},
+        pipeline.run_full_pipeline(subreddits=["test", "test"])
+
+        pipeline_mocks.scorer.score_multiple_posts.assert_called_once_with(list(_BASIC_POSTS))
+
+    def test_run_full_pipeline_fetches_histories_concurrently(self, pipeline, pipeline_mocks, monkeypatch):
+        """Test user histories are fetched in parallel rather than one after another"""
+        authors = [f"user{i}" for i in range(10)]
+        monkeypatch.setattr(settings, "max_concurrent_requests", len(authors))
+        monkeypatch.setattr(
+            pipeline_module, "UserMonitor",
+            Mock(return_value=Mock(**{"run_daily_monitoring.return_value": _EMPTY_MONITORING_SUMMARY})),
+        )
+        posts = [{"id": f"post{i}", "author": a, "title": "Test"} for i, a in enumerate(authors)]
+        pipeline_mocks.scraper.iter_subreddit_posts.return_value = [posts]
+        pipeline_mocks.scorer.score_multiple_posts.return_value = [
+            {**p, "risk_assessment": {"risk_score": 10}} for p in posts
         ]
-        mock_scraper.get_user_history.return_value = {
-            "username": "high_risk_user",
-            "posts": [],
-            "comments": [],
-            "total_posts": 1,
-            "total_comments": 1,
+        all_started = threading.Barrier(len(authors), timeout=1)
+
+        def fetch(user, **kwargs):
+            # Every fetch waits for the others; serial fetching would time out here
+            all_started.wait()
+            return {"username": user, **_USER_HISTORY_STUB}
+
+        pipeline_mocks.scraper.get_user_history.side_effect = fetch
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = []
+        pipeline_mocks.scorer.score_multiple_users.return_value = []
+
+        pipeline.run_full_pipeline(subreddits=["test"], max_users_to_enrich=len(authors))
+
+        assert pipeline_mocks.scraper.get_user_history.call_count == len(authors)
+        assert not all_started.broken
+
+    def test_run_full_pipeline_reuses_cached_user_history(self, pipeline, pipeline_mocks):
+        """Test a second run within the cache TTL does not re-fetch user history"""
+        pipeline_mocks.scraper.iter_subreddit_posts.return_value = [_BASIC_POSTS]
+        pipeline_mocks.scorer.score_multiple_posts.return_value = _BASIC_SCORED_POSTS
+        pipeline_mocks.scraper.get_user_history.return_value = {"username": "user1", **_USER_HISTORY_STUB}
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = []
+        pipeline_mocks.scorer.score_multiple_users.return_value = []
+
+        for _ in range(2):
+            pipeline.run_full_pipeline(subreddits=["test"])
+
+        assert pipeline_mocks.scraper.get_user_history.call_count == 1
+
+    def test_empty_user_history_not_cached(self, pipeline, pipeline_mocks):
+        """Test an empty or failed fetch is retried instead of cached for the TTL"""
+        pipeline_mocks.scraper.get_user_history.return_value = {
+            "username": "user1", "posts": [], "comments": [], "total_posts": 0, "total_comments": 0
         }
-        MockScraper.return_value = mock_scraper
 
-        mock_enricher = MagicMock()
-        mock_enricher.enrich_multiple_users.return_value = [
-            {"username": "high_risk_user", "content": {"all_text": []}}
-        ]
-        MockEnricher.return_value = mock_enricher
-
-        mock_scorer = MagicMock()
-        # High risk post (risk_score >= 50 for high risk)
-        mock_scorer.score_multiple_posts.return_value = [
-            {
-                "id": "post1",
-                "author": "low_risk_user",
-                "title": "Normal post",
-                "subreddit": "test",
-                "risk_assessment": {"risk_score": 10, "risk_level": "low", "hate_score": 5, "violence_score": 5, "flags": []},
-            },
-            {
-                "id": "post2",
-                "author": "high_risk_user",
-                "title": "Risky post",
-                "subreddit": "test",
-                "risk_assessment": {"risk_score": 70, "risk_level": "critical", "hate_score": 40, "violence_score": 30, "flags": ["hate"]},
-            },
-        ]
-        mock_scorer.score_multiple_users.return_value = [
-            {
-                "username": "high_risk_user",
-                "risk_assessment": {"overall_risk_score": 70, "risk_level": "critical"},
-            }
-        ]
-        MockScorer.return_value = mock_scorer
+        pipeline._fetch_user_history("user1")
+        pipeline._fetch_user_history("user1")
 
-        mock_api_client = MagicMock()
-        mock_api_client.health_check.return_value = True
-        mock_api_client.send_posts.return_value = BulkResult(created=2)
-        mock_api_client.send_users.return_value = BulkResult(created=1)
-        MockAPIClient.return_value = mock_api_client
+        assert pipeline_mocks.scraper.get_user_history.call_count == 2
 
-        # Run pipeline with limit of 1 user
-        pipeline = DataPipeline()
-        result = pipeline.run_full_pipeline(
-            subreddits=["test"],
-            posts_per_subreddit=10,
-            max_users_to_enrich=1,
+    def test_user_history_cache_disabled_with_zero_ttl(self, pipeline, pipeline_mocks, monkeypatch):
+        """Test a TTL of 0 fetches user history on every call"""
+        monkeypatch.setattr(settings, "user_history_cache_ttl", 0)
+
+        pipeline._fetch_user_history("user1")
+        pipeline._fetch_user_history("user1")
+
+        assert pipeline_mocks.scraper.get_user_history.call_count == 2
+
+    def test_run_full_pipeline_scores_while_collecting(self, pipeline, pipeline_mocks):
+        """Test a subreddit's posts are scored before the next subreddit is collected"""
+        first_scored = threading.Event()
+        scored_before_second = []
+
+        def subreddit_batches(subreddits, posts_per_subreddit):
+            yield [{"id": "post1", "author": "[deleted]"}]
+            scored_before_second.append(first_scored.wait(timeout=1))
+            yield [{"id": "post2", "author": "[deleted]"}]
+
+        def score(posts):
+            first_scored.set()
+            return [{**p, "risk_assessment": {"risk_score": 10}} for p in posts]
+
+        pipeline_mocks.scraper.iter_subreddit_posts.side_effect = subreddit_batches
+        pipeline_mocks.scorer.score_multiple_posts.side_effect = score
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = []
+        pipeline_mocks.scorer.score_multiple_users.return_value = []
+
+        result = pipeline.run_full_pipeline(subreddits=["sub1", "sub2"])
+
+        assert scored_before_second == [True]
+        assert [p["id"] for p in result["posts"]] == ["post1", "post2"]
+
+    def test_run_full_pipeline_scores_while_searching(self, pipeline, pipeline_mocks, monkeypatch):
+        """Test scoring of collected posts starts before the search requests finish"""
+        monkeypatch.setattr(
+            pipeline_module, "UserMonitor",
+            Mock(return_value=Mock(**{"run_daily_monitoring.return_value": _EMPTY_MONITORING_SUMMARY})),
         )
+        stage_events = {"score_start": [], "search_end": []}
+
+        def search(query, limit):
+            time.sleep(0.02)
+            stage_events["search_end"].append(time.perf_counter())
+            return [{"id": query, "author": "[deleted]", "title": query}]
+
+        def score(posts):
+            stage_events["score_start"].append(time.perf_counter())
+            return [{**p, "risk_assessment": {"risk_score": 10}} for p in posts]
+
+        pipeline_mocks.scraper.iter_subreddit_posts.return_value = [_BASIC_POSTS]
+        pipeline_mocks.scraper.search_posts.side_effect = search
+        pipeline_mocks.scorer.score_multiple_posts.side_effect = score
+        pipeline_mocks.scraper.get_user_history.return_value = {"username": "user1", **_USER_HISTORY_STUB}
+        pipeline_mocks.enricher.enrich_multiple_users.return_value = []
+        pipeline_mocks.scorer.score_multiple_users.return_value = []
+
+        result = pipeline.run_full_pipeline(subreddits=["test"], search_terms=["a", "b", "c"])
 
-        # High risk user should be prioritized
-        call_args = mock_scraper.get_user_history.call_args
-        assert call_args[0][0] == "high_risk_user"
+        assert stage_events["score_start"][0] < stage_events["search_end"][-1]
+        assert [p["id"] for p in result["posts"]] == ["post1", "a", "b", "c"]
 
 
 class TestSendToAPI:
     """Tests for _send_to_api method"""
 
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_send_to_api_success(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
+    def test_send_to_api_success(self, pipeline, pipeline_mocks):
         """Test successful API sending"""
-        mock_api_client = MagicMock()
-        mock_api_client.health_check.return_value = True
-        mock_api_client.send_posts.return_value = BulkResult(created=5)
-        mock_api_client.send_users.return_value = BulkResult(created=3)
-        MockAPIClient.return_value = mock_api_client
+        pipeline_mocks.api.send_posts.return_value = _BULK_5
+        pipeline_mocks.api.send_users.return_value = _BULK_3
 
-        pipeline = DataPipeline()
-        pipeline._send_to_api(
-            [{"id": "post1"}],
-            [{"username": "user1"}],
-        )
+        pipeline._send_to_api(_SEND_POSTS, _SEND_USERS)
+
+        pipeline_mocks.api.health_check.assert_called_once()
+        pipeline_mocks.api.send_posts.assert_called_once()
+        pipeline_mocks.api.send_users.assert_called_once()
+
+    def test_send_to_api_sends_users_before_posts(self, pipeline, pipeline_mocks):
+        """Test users are stored before the posts that reference them"""
+        order = []
+        pipeline_mocks.api.send_users.side_effect = lambda batch: order.append("users") or _BULK_3
+        pipeline_mocks.api.send_posts.side_effect = lambda batch: order.append("posts") or _BULK_5
+
+        pipeline._send_to_api(_SEND_POSTS, _SEND_USERS)
 
-        mock_api_client.health_check.assert_called_once()
-        mock_api_client.send_posts.assert_called_once()
-        mock_api_client.send_users.assert_called_once()
+        assert order == ["users", "posts"]
 
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_send_to_api_health_check_fails(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
+    def test_send_to_api_health_check_fails(self, pipeline, pipeline_mocks):
         """Test API sending when health check fails"""
-        mock_api_client = MagicMock()
-        mock_api_client.health_check.return_value = False
-        MockAPIClient.return_value = mock_api_client
+        pipeline_mocks.api.health_check.return_value = False
 
-        pipeline = DataPipeline()
-        pipeline._send_to_api(
-            [{"id": "post1"}],
-            [{"username": "user1"}],
-        )
+        pipeline._send_to_api(_SEND_POSTS, _SEND_USERS)
 
         # Should not attempt to send if health check fails
-        mock_api_client.send_posts.assert_not_called()
-        mock_api_client.send_users.assert_not_called()
-
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_send_to_api_handles_exception(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
+        pipeline_mocks.api.send_posts.assert_not_called()
+        pipeline_mocks.api.send_users.assert_not_called()
+
+    def test_send_to_api_handles_exception(self, pipeline, pipeline_mocks):
         """Test API sending handles exceptions gracefully"""
-        mock_api_client = MagicMock()
-        mock_api_client.health_check.return_value = True
-        mock_api_client.send_posts.side_effect = Exception("API Error")
-        MockAPIClient.return_value = mock_api_client
+        pipeline_mocks.api.send_posts.side_effect = Exception("API Error")
 
-        pipeline = DataPipeline()
         # Should not raise exception
-        pipeline._send_to_api(
-            [{"id": "post1"}],
-            [{"username": "user1"}],
-        )
+        pipeline._send_to_api(_SEND_POSTS, _SEND_USERS)
+
+    @pytest.mark.parametrize(
+        "n_posts,batch_size,expected_calls",
+        [(1, 20, 1), (20, 20, 1), (21, 20, 2), (55, 20, 3)],
+    )
+    def test_send_to_api_batches_posts(self, pipeline, pipeline_mocks, monkeypatch,
+                                       n_posts, batch_size, expected_calls):
+        """Test posts are sent in ceil(n / batch_size) bulk requests"""
+        monkeypatch.setattr(settings, "api_batch_size", batch_size)
+        pipeline_mocks.api.send_posts.side_effect = lambda batch: BulkResult(created=len(batch))
+        posts = [{"id": f"post{i}"} for i in range(n_posts)]
+
+        pipeline._send_to_api(posts, [])
+
+        send_posts = pipeline_mocks.api.send_posts
+        assert send_posts.call_count == expected_calls
+        assert sum(len(c.args[0]) for c in send_posts.call_args_list) == n_posts
+        pipeline_mocks.api.send_users.assert_not_called()
+
+    def test_send_to_api_sends_batches_concurrently(self, pipeline, pipeline_mocks, monkeypatch):
+        """Test multiple batches are in flight at the same time"""
+        monkeypatch.setattr(settings, "api_batch_size", 2)
+        monkeypatch.setattr(settings, "max_concurrent_requests", 2)
+        both_started = threading.Barrier(2, timeout=1)
+
+        def send(batch):
+            # Each batch waits for the other; serial sends would time out here
+            both_started.wait()
+            return BulkResult(created=len(batch))
+
+        pipeline_mocks.api.send_posts.side_effect = send
+        posts = [{"id": f"post{i}"} for i in range(4)]
+        result = pipeline._send_in_batches(pipeline_mocks.api.send_posts, posts)
+
+        assert result.created == 4
 
 
 class TestLogSummaryReport:
     """Tests for _log_summary_report method"""
 
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_log_summary_report(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
+    def test_log_summary_report(self, pipeline):
         """Test summary report logging"""
-        pipeline = DataPipeline()
-
-        all_posts = [{"id": "1"}, {"id": "2"}]
-        scored_posts = [
-            {"id": "1", "risk_assessment": {"risk_score": 10}},
-            {"id": "2", "risk_assessment": {"risk_score": 60}},
-        ]
-        high_risk_posts = [scored_posts[1]]
-        scored_users = [
-            {
-                "username": "user1",
-                "risk_assessment": {"overall_risk_score": 50, "risk_level": "high"},
-            }
-        ]
-        risk_distribution = {
-            "critical": 0,
-            "high": 1,
-            "medium": 0,
-            "low": 0,
-            "minimal": 0,
-        }
-
         # Should not raise any exceptions
         pipeline._log_summary_report(
-            all_posts,
-            scored_posts,
-            high_risk_posts,
-            scored_users,
-            risk_distribution,
+            _SUMMARY_ALL_POSTS,
+            _SUMMARY_SCORED_POSTS,
+            _SUMMARY_SCORED_POSTS[1:],
+            _SUMMARY_SCORED_USERS,
+            _SUMMARY_RISK_DISTRIBUTION,
         )
 
-    @patch("src.pipeline.APIClient")
-    @patch("src.pipeline.HateSpeechScorer")
-    @patch("src.pipeline.UserEnricher")
-    @patch("src.pipeline.RedditScraper")
-    def test_log_summary_report_empty_data(self, MockScraper, MockEnricher, MockScorer, MockAPIClient):
+    def test_log_summary_report_empty_data(self, pipeline):
         """Test summary report with empty data"""
-        pipeline = DataPipeline()
-
         # Should handle empty data without errors
         pipeline._log_summary_report([], [], [], [], {})
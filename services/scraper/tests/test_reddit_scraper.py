@@ -2,10 +2,11 @@
 import pytest
 import responses
 import json
+import threading
 from unittest.mock import patch, MagicMock
 from requests.exceptions import HTTPError, RequestException
 
-from src.collectors.reddit_scraper import RedditScraper
+from src.collectors.reddit_scraper import MAX_RATE_LIMIT_BACKOFF, MAX_RATE_LIMIT_RETRIES, RedditScraper
 
 
 class TestRedditScraperInit:
@@ -15,6 +16,7 @@ class TestRedditScraperInit:
         """Test default rate limit delay"""
         scraper = RedditScraper()
         assert scraper.rate_limit_delay == 2.0
+        assert scraper.max_workers == 1
 
     def test_init_custom_rate_limit(self):
         """Test custom rate limit delay"""
@@ -26,6 +28,12 @@ class TestRedditScraperInit:
         scraper = RedditScraper()
         assert "User-Agent" in scraper.session.headers
 
+    def test_init_sizes_pool_to_workers(self):
+        """Test the connection pool grows with max_workers"""
+        scraper = RedditScraper(max_workers=32)
+        adapter = scraper.session.get_adapter("https://www.reddit.com")
+        assert adapter._pool_maxsize == 32
+
 
 class TestGetSubredditPosts:
     """Tests for get_subreddit_posts method"""
@@ -160,6 +168,35 @@ class TestGetUserPosts:
 
         assert posts == []
 
+    @responses.activate
+    def test_get_user_posts_retries_after_rate_limit(self, sample_user_posts_response):
+        """Test a 429 is retried after Retry-After instead of ending the history early"""
+        url = "https://www.reddit.com/user/test_user/submitted.json?limit=100"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.GET, url, json=sample_user_posts_response, status=200)
+
+        scraper = RedditScraper(rate_limit_delay=0)
+        posts = scraper.get_user_posts("test_user")
+
+        assert len(posts) == 1
+        assert len(responses.calls) == 2
+
+    @pytest.mark.parametrize("retry_after", ["86400", "inf", "nan", "-5"])
+    @responses.activate
+    def test_get_user_posts_retry_after_is_bounded(self, retry_after, monkeypatch, sample_user_posts_response):
+        """Test a huge, non-finite or negative Retry-After can't stall the scraper"""
+        url = "https://www.reddit.com/user/test_user/submitted.json?limit=100"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": retry_after})
+        responses.add(responses.GET, url, json=sample_user_posts_response, status=200)
+        sleep = MagicMock()
+        monkeypatch.setattr("src.collectors.reddit_scraper.time.sleep", sleep)
+
+        scraper = RedditScraper(rate_limit_delay=0)
+        posts = scraper.get_user_posts("test_user")
+
+        assert len(posts) == 1
+        assert all(0 <= call.args[0] <= MAX_RATE_LIMIT_BACKOFF for call in sleep.call_args_list)
+
 
 class TestGetUserComments:
     """Tests for get_user_comments method"""
@@ -283,6 +320,21 @@ class TestSearchPosts:
 
         assert len(posts) == 2
 
+    @responses.activate
+    def test_search_posts_encodes_query(self, sample_reddit_post_response):
+        """Test search terms with spaces and reserved characters are URL-encoded"""
+        responses.add(
+            responses.GET,
+            "https://www.reddit.com/search.json",
+            json=sample_reddit_post_response,
+            status=200,
+        )
+
+        scraper = RedditScraper(rate_limit_delay=0)
+        scraper.search_posts("hate & violence")
+
+        assert "q=hate+%26+violence" in responses.calls[0].request.url
+
     @responses.activate
     def test_search_posts_error(self):
         """Test search error handling"""
@@ -345,6 +397,52 @@ class TestCollectFromMultipleSubreddits:
         # Only posts from good_sub
         assert len(posts) == 2
 
+    def test_collect_from_multiple_subreddits_concurrently(self):
+        """Test subreddits are fetched in parallel and results keep subreddit order"""
+        all_started = threading.Barrier(3, timeout=1)
+
+        def fetch(subreddit, limit):
+            # Every fetch waits for the others; serial fetching would time out here
+            all_started.wait()
+            return [{"id": f"{subreddit}_post"}]
+
+        scraper = RedditScraper(rate_limit_delay=0, max_workers=3)
+        with patch.object(scraper, "get_subreddit_posts", side_effect=fetch):
+            posts = scraper.collect_from_multiple_subreddits(["sub1", "sub2", "sub3"])
+
+        assert [p["id"] for p in posts] == ["sub1_post", "sub2_post", "sub3_post"]
+
+    def test_iter_subreddit_posts_yields_each_subreddit(self):
+        """Test each subreddit's posts are yielded as a separate batch in subreddit order"""
+        def fetch(subreddit, limit):
+            return [{"id": f"{subreddit}_post"}]
+
+        scraper = RedditScraper(rate_limit_delay=0, max_workers=2)
+        with patch.object(scraper, "get_subreddit_posts", side_effect=fetch):
+            batches = list(scraper.iter_subreddit_posts(["sub1", "sub2"]))
+
+        assert batches == [[{"id": "sub1_post"}], [{"id": "sub2_post"}]]
+
+    @responses.activate
+    def test_collect_from_multiple_subreddits_shares_rate_limit(self, sample_reddit_post_response):
+        """Test concurrent subreddit fetches are spaced by the shared limiter"""
+        for subreddit in ("sub1", "sub2", "sub3"):
+            responses.add(
+                responses.GET,
+                f"https://www.reddit.com/r/{subreddit}/new.json?limit=10",
+                json=sample_reddit_post_response,
+                status=200,
+            )
+        sleeps = []
+
+        scraper = RedditScraper(rate_limit_delay=2.0, max_workers=3)
+        with patch("src.collectors.reddit_scraper.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            mock_time.sleep.side_effect = sleeps.append
+            scraper.collect_from_multiple_subreddits(["sub1", "sub2", "sub3"], posts_per_subreddit=10)
+
+        assert sorted(sleeps) == [2.0, 4.0]
+
 
 class TestRateLimiting:
     """Tests for rate limiting"""
@@ -364,3 +462,32 @@ class TestRateLimiting:
         with patch.object(scraper, "_wait") as mock_wait:
             scraper.get_subreddit_posts("test")
             mock_wait.assert_called_once()
+
+    def test_rate_limit_shared_across_threads(self):
+        """Test concurrent callers are spaced one delay apart rather than each sleeping once"""
+        scraper = RedditScraper(rate_limit_delay=2.0)
+        sleeps = []
+
+        with patch("src.collectors.reddit_scraper.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            mock_time.sleep.side_effect = sleeps.append
+            threads = [threading.Thread(target=scraper._wait) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # First request goes out immediately, the others queue behind it
+        assert sorted(sleeps) == [2.0, 4.0]
+
+    @responses.activate
+    def test_rate_limit_gives_up_after_retries(self):
+        """Test persistent 429s end in the usual HTTP error handling"""
+        url = "https://www.reddit.com/r/test/new.json?limit=100"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "0"})
+
+        scraper = RedditScraper(rate_limit_delay=0)
+        posts = scraper.get_subreddit_posts("test")
+
+        assert posts == []
+        assert len(responses.calls) == MAX_RATE_LIMIT_RETRIES + 1
@@ -9,20 +9,14 @@ from src.enrichers.user_enricher import UserEnricher
 class TestUserEnricherInit:
     """Tests for UserEnricher initialization"""
 
-    def test_init_sets_history_cutoff(self):
-        """Test that history_cutoff is set correctly with default 60 days"""
+    def test_init_default_history_days(self):
+        """Test that the history window defaults to 60 days"""
         enricher = UserEnricher()
-        expected = (datetime.now() - timedelta(days=60)).timestamp()
-        # Allow 1 second tolerance
-        assert abs(enricher.history_cutoff - expected) < 1
         assert enricher.user_history_days == 60
 
     def test_init_with_custom_days(self):
-        """Test that history_cutoff is set correctly with custom days"""
+        """Test that the history window can be configured"""
         enricher = UserEnricher(user_history_days=30)
-        expected = (datetime.now() - timedelta(days=30)).timestamp()
-        # Allow 1 second tolerance
-        assert abs(enricher.history_cutoff - expected) < 1
         assert enricher.user_history_days == 30
 
 
@@ -51,6 +45,16 @@ class TestEnrichUserData:
         assert enriched["activity_metrics"]["recent_comments_2m"] == 1
         assert enriched["activity_metrics"]["total_recent_activity"] == 2
 
+    def test_enrich_user_data_window_follows_now(self, sample_raw_user_data):
+        """Test the history window is measured back from the given reference time"""
+        enricher = UserEnricher(user_history_days=60)
+        later = datetime.now() + timedelta(days=45)
+
+        enriched = enricher.enrich_user_data(sample_raw_user_data, now=later)
+
+        assert enriched["activity_metrics"]["recent_posts_2m"] == 0
+        assert enriched["enrichment_timestamp"] == later.isoformat()
+
     def test_enrich_user_data_calculates_averages(self, sample_raw_user_data):
         """Test average score calculations"""
         enricher = UserEnricher()
@@ -136,6 +140,18 @@ class TestDetermineProfileStatus:
         status = enricher._determine_profile_status(100, [], [])
         assert status == "high_activity"
 
+    @pytest.mark.parametrize("total,expected", [
+        (1, "low_activity"),
+        (9, "low_activity"),
+        (10, "moderate_activity"),
+        (49, "moderate_activity"),
+        (50, "high_activity"),
+    ])
+    def test_activity_boundaries(self, total, expected):
+        """Test each threshold starts the next status level"""
+        enricher = UserEnricher()
+        assert enricher._determine_profile_status(total, [], []) == expected
+
 
 class TestEnrichMultipleUsers:
     """Tests for enrich_multiple_users method"""
@@ -144,11 +160,8 @@ class TestEnrichMultipleUsers:
         """Test enriching multiple users"""
         enricher = UserEnricher()
 
-        user1 = sample_raw_user_data.copy()
-        user1["username"] = "user1"
-
-        user2 = sample_raw_user_data.copy()
-        user2["username"] = "user2"
+        user1 = {**sample_raw_user_data, "username": "user1"}
+        user2 = {**sample_raw_user_data, "username": "user2"}
 
         users = [user1, user2]
         enriched = enricher.enrich_multiple_users(users)
@@ -157,11 +170,20 @@ class TestEnrichMultipleUsers:
         assert enriched[0]["username"] == "user1"
         assert enriched[1]["username"] == "user2"
 
+    def test_enrich_multiple_users_shares_timestamp(self, sample_raw_user_data):
+        """Test one batch is enriched against a single reference time"""
+        enricher = UserEnricher()
+        users = [{**sample_raw_user_data, "username": f"user{i}"} for i in range(3)]
+
+        enriched = enricher.enrich_multiple_users(users)
+
+        assert len({e["enrichment_timestamp"] for e in enriched}) == 1
+
     def test_enrich_multiple_users_handles_errors(self, sample_raw_user_data):
         """Test that errors don't stop processing"""
         enricher = UserEnricher()
 
-        valid_user = sample_raw_user_data.copy()
+        valid_user = sample_raw_user_data
 
         # Create an invalid user that will cause an error but is not None
         # (so the error handler can still call .get() on it)